@@ -0,0 +1,43 @@
+"""add_alert_status_type_and_ongoing_trip_indexes
+
+Revision ID: 1c631cecc248
+Revises: c416ece0ee26
+Create Date: 2026-10-17 09:12:44.318205
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "1c631cecc248"
+down_revision: Union[str, Sequence[str], None] = "c416ece0ee26"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add covering alert stats index and partial index for ongoing trips."""
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        # Serves status/alert_type filters and GROUP BY counts as index-only scans
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_alerts_status_alert_type "
+            "ON alerts (status, alert_type) INCLUDE (id)"
+        )
+        # Only ongoing trips are scanned by the admin live-tracking queries
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_trips_ongoing "
+            "ON trips (id) WHERE status = 'ONGOING'"
+        )
+
+
+def downgrade() -> None:
+    """Drop covering alert stats index and partial index for ongoing trips."""
+
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_trips_ongoing")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_alerts_status_alert_type")
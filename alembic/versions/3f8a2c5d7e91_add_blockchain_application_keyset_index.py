@@ -0,0 +1,39 @@
+"""add_blockchain_application_keyset_index
+
+Revision ID: 3f8a2c5d7e91
+Revises: 9e4b7a1d2c6f
+Create Date: 2026-10-17 15:21:08.904117
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3f8a2c5d7e91"
+down_revision: Union[str, Sequence[str], None] = "9e4b7a1d2c6f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add (applied_at, id) index for blockchain application keyset pagination."""
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS "
+            "ix_blockchain_applications_applied_at_id "
+            "ON blockchain_applications (applied_at, id)"
+        )
+
+
+def downgrade() -> None:
+    """Drop (applied_at, id) index for blockchain application keyset pagination."""
+
+    with op.get_context().autocommit_block():
+        op.execute(
+            "DROP INDEX CONCURRENTLY IF EXISTS ix_blockchain_applications_applied_at_id"
+        )
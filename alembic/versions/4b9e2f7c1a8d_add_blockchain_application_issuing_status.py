@@ -0,0 +1,67 @@
+"""add_blockchain_application_issuing_status
+
+Revision ID: 4b9e2f7c1a8d
+Revises: c6e2a8d4f0b1
+Create Date: 2026-10-17 19:12:05.481327
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "4b9e2f7c1a8d"
+down_revision: Union[str, Sequence[str], None] = "c6e2a8d4f0b1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add the ISSUING status and count it as an active application."""
+
+    # The new enum value must be committed before an index predicate can use
+    # it, and CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.execute(
+            "ALTER TYPE blockchainapplicationstatusenum ADD VALUE IF NOT EXISTS 'ISSUING'"
+        )
+        op.execute(
+            "CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS "
+            "uq_blockchain_applications_active_user_new "
+            "ON blockchain_applications (user_id) "
+            "WHERE status IN ('PENDING', 'ISSUING', 'ISSUED')"
+        )
+        op.execute(
+            "DROP INDEX CONCURRENTLY IF EXISTS uq_blockchain_applications_active_user"
+        )
+        op.execute(
+            "ALTER INDEX uq_blockchain_applications_active_user_new "
+            "RENAME TO uq_blockchain_applications_active_user"
+        )
+
+
+def downgrade() -> None:
+    """Narrow the active index back to pending and issued applications."""
+
+    # PostgreSQL cannot drop an enum value, so ISSUING stays in the type;
+    # in-flight claims go back to PENDING so they remain active
+    op.execute(
+        "UPDATE blockchain_applications SET status = 'PENDING' WHERE status = 'ISSUING'"
+    )
+
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS "
+            "uq_blockchain_applications_active_user_old "
+            "ON blockchain_applications (user_id) "
+            "WHERE status IN ('PENDING', 'ISSUED')"
+        )
+        op.execute(
+            "DROP INDEX CONCURRENTLY IF EXISTS uq_blockchain_applications_active_user"
+        )
+        op.execute(
+            "ALTER INDEX uq_blockchain_applications_active_user_old "
+            "RENAME TO uq_blockchain_applications_active_user"
+        )
@@ -0,0 +1,34 @@
+"""add_user_blockchain_issuing_since
+
+Revision ID: 7d3c5e9a2b4f
+Revises: 4b9e2f7c1a8d
+Create Date: 2026-10-17 19:38:51.207614
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7d3c5e9a2b4f"
+down_revision: Union[str, Sequence[str], None] = "4b9e2f7c1a8d"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Track in-flight entry-point blockchain ID issuance per user."""
+
+    op.add_column(
+        "users",
+        sa.Column("blockchain_issuing_since", sa.DateTime(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Drop the entry-point issuance claim column."""
+
+    op.drop_column("users", "blockchain_issuing_since")
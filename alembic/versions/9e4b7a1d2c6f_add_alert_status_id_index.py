@@ -0,0 +1,36 @@
+"""add_alert_status_id_index
+
+Revision ID: 9e4b7a1d2c6f
+Revises: 1c631cecc248
+Create Date: 2026-10-17 14:03:27.561842
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9e4b7a1d2c6f"
+down_revision: Union[str, Sequence[str], None] = "1c631cecc248"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add index for newest-first keyset pagination of alerts by status."""
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_alerts_status_id "
+            "ON alerts (status, id)"
+        )
+
+
+def downgrade() -> None:
+    """Drop index for newest-first keyset pagination of alerts by status."""
+
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_alerts_status_id")
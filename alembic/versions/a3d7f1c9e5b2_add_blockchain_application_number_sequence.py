@@ -0,0 +1,30 @@
+"""add_blockchain_application_number_sequence
+
+Revision ID: a3d7f1c9e5b2
+Revises: f8b2d4e6a1c7
+Create Date: 2026-10-17 17:24:08.915337
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a3d7f1c9e5b2"
+down_revision: Union[str, Sequence[str], None] = "f8b2d4e6a1c7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add the sequence that numbers blockchain applications."""
+
+    op.execute("CREATE SEQUENCE IF NOT EXISTS blockchain_application_number_seq")
+
+
+def downgrade() -> None:
+    """Drop the blockchain application number sequence."""
+
+    op.execute("DROP SEQUENCE IF EXISTS blockchain_application_number_seq")
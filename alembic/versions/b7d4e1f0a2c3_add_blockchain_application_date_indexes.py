@@ -0,0 +1,48 @@
+"""add_blockchain_application_date_indexes
+
+Revision ID: b7d4e1f0a2c3
+Revises: 3f8a2c5d7e91
+Create Date: 2026-10-17 15:58:42.117630
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b7d4e1f0a2c3"
+down_revision: Union[str, Sequence[str], None] = "3f8a2c5d7e91"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add status/applied_at and issued_at indexes on blockchain applications."""
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS "
+            "ix_blockchain_applications_status_applied_at "
+            "ON blockchain_applications (status, applied_at)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS "
+            "ix_blockchain_applications_issued_at "
+            "ON blockchain_applications (issued_at)"
+        )
+
+
+def downgrade() -> None:
+    """Drop status/applied_at and issued_at indexes on blockchain applications."""
+
+    with op.get_context().autocommit_block():
+        op.execute(
+            "DROP INDEX CONCURRENTLY IF EXISTS ix_blockchain_applications_issued_at"
+        )
+        op.execute(
+            "DROP INDEX CONCURRENTLY IF EXISTS "
+            "ix_blockchain_applications_status_applied_at"
+        )
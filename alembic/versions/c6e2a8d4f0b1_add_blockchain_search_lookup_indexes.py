@@ -0,0 +1,47 @@
+"""add_blockchain_search_lookup_indexes
+
+Revision ID: c6e2a8d4f0b1
+Revises: a3d7f1c9e5b2
+Create Date: 2026-10-17 17:46:33.208164
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c6e2a8d4f0b1"
+down_revision: Union[str, Sequence[str], None] = "a3d7f1c9e5b2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index user_id and transaction_hash for admin application search."""
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS "
+            "ix_blockchain_applications_user_id "
+            "ON blockchain_applications (user_id)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS "
+            "ix_blockchain_ids_transaction_hash "
+            "ON blockchain_ids (transaction_hash)"
+        )
+
+
+def downgrade() -> None:
+    """Drop the admin application search lookup indexes."""
+
+    with op.get_context().autocommit_block():
+        op.execute(
+            "DROP INDEX CONCURRENTLY IF EXISTS ix_blockchain_ids_transaction_hash"
+        )
+        op.execute(
+            "DROP INDEX CONCURRENTLY IF EXISTS ix_blockchain_applications_user_id"
+        )
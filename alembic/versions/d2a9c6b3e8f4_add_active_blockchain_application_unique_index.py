@@ -0,0 +1,40 @@
+"""add_active_blockchain_application_unique_index
+
+Revision ID: d2a9c6b3e8f4
+Revises: b7d4e1f0a2c3
+Create Date: 2026-10-17 16:20:13.482905
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d2a9c6b3e8f4"
+down_revision: Union[str, Sequence[str], None] = "b7d4e1f0a2c3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Allow at most one pending or issued blockchain application per user."""
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS "
+            "uq_blockchain_applications_active_user "
+            "ON blockchain_applications (user_id) "
+            "WHERE status IN ('PENDING', 'ISSUED')"
+        )
+
+
+def downgrade() -> None:
+    """Drop the one-active-application-per-user unique index."""
+
+    with op.get_context().autocommit_block():
+        op.execute(
+            "DROP INDEX CONCURRENTLY IF EXISTS uq_blockchain_applications_active_user"
+        )
@@ -0,0 +1,50 @@
+"""add_blockchain_application_status_covering_index
+
+Revision ID: e5c1f7a9b3d6
+Revises: d2a9c6b3e8f4
+Create Date: 2026-10-17 16:41:27.305518
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e5c1f7a9b3d6"
+down_revision: Union[str, Sequence[str], None] = "d2a9c6b3e8f4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Replace the status/applied_at index with a covering newest-first one."""
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS "
+            "ix_blockchain_applications_status_applied_desc "
+            "ON blockchain_applications (status, applied_at DESC, id DESC) "
+            "INCLUDE (application_number, user_id, itinerary_id)"
+        )
+        op.execute(
+            "DROP INDEX CONCURRENTLY IF EXISTS "
+            "ix_blockchain_applications_status_applied_at"
+        )
+
+
+def downgrade() -> None:
+    """Restore the plain status/applied_at index."""
+
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS "
+            "ix_blockchain_applications_status_applied_at "
+            "ON blockchain_applications (status, applied_at)"
+        )
+        op.execute(
+            "DROP INDEX CONCURRENTLY IF EXISTS "
+            "ix_blockchain_applications_status_applied_desc"
+        )
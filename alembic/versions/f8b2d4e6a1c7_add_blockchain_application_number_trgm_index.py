@@ -0,0 +1,43 @@
+"""add_blockchain_application_number_trgm_index
+
+Revision ID: f8b2d4e6a1c7
+Revises: e5c1f7a9b3d6
+Create Date: 2026-10-17 17:05:51.640213
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f8b2d4e6a1c7"
+down_revision: Union[str, Sequence[str], None] = "e5c1f7a9b3d6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add a trigram index for substring search on application numbers."""
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS "
+            "ix_blockchain_applications_application_number_trgm "
+            "ON blockchain_applications "
+            "USING gin (application_number gin_trgm_ops)"
+        )
+
+
+def downgrade() -> None:
+    """Drop the application number trigram index (pg_trgm is left installed)."""
+
+    with op.get_context().autocommit_block():
+        op.execute(
+            "DROP INDEX CONCURRENTLY IF EXISTS "
+            "ix_blockchain_applications_application_number_trgm"
+        )
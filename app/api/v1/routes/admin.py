@@ -154,16 +154,11 @@ async def get_unverified_users(
     )
 
     # Get total unverified count
-    all_unverified = await UserService.get_all_users(
-        db=db,
-        is_verified_filter=False,
-        limit=10000,
-        offset=0,
-    )
+    total_count = await UserService.count_users(db=db, is_verified_filter=False)
 
     return UserListResponse(
         users=users,
-        total_count=len(all_unverified),
+        total_count=total_count,
         offset=offset,
         limit=limit,
     )
@@ -205,19 +200,16 @@ async def list_all_users(
         )
 
         # Get total count for pagination info
-        # Note: In production, you might want to optimize this with a separate count query
-        all_users = await UserService.get_all_users(
+        total_count = await UserService.count_users(
             db=db,
             role_filter=role_filter,
             is_active_filter=is_active_filter,
             is_verified_filter=is_verified_filter,
-            limit=10000,  # Large limit to get total count
-            offset=0,
         )
 
         return UserListResponse(
             users=users,
-            total_count=len(all_users),
+            total_count=total_count,
             offset=offset,
             limit=limit,
         )
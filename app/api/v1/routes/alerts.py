@@ -12,6 +12,7 @@ from app.models.schemas.alerts import (
     AlertStatsResponse,
 )
 from app.services import alerts as alerts_service
+from app.utils.validation import type_adapter
 
 router = APIRouter(prefix="/alerts", tags=["alerts"])
 
@@ -25,9 +26,7 @@ async def create_alert(
 ):
     """Create a new alert by user."""
     try:
-        alert = await alerts_service.create_alert(
-            alert_data, current_user.id, db
-        )
+        alert = await alerts_service.create_alert(alert_data, current_user.id, db)
         return AlertResponse.model_validate(alert)
     except Exception as e:
         raise HTTPException(
@@ -40,6 +39,7 @@ async def create_alert(
 async def get_alerts(
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    before_id: Optional[int] = Query(None, ge=1),
     alert_type: Optional[AlertTypeEnum] = Query(None),
     status_filter: Optional[AlertStatusEnum] = Query(AlertStatusEnum.ACTIVE),
     current_user: User = Depends(get_current_user),
@@ -47,23 +47,23 @@ async def get_alerts(
 ):
     """Get alerts with optional filters and pagination."""
     try:
-        alerts, total_count = await alerts_service.get_all_alerts(
+        alerts, total_count, next_before_id = await alerts_service.get_all_alerts(
             page=page,
             page_size=page_size,
             alert_type=alert_type,
             status=status_filter,
             db=db,
+            before_id=before_id,
         )
 
-        alert_responses = [
-            AlertResponse.model_validate(alert) for alert in alerts
-        ]
+        alert_responses = type_adapter(List[AlertResponse]).validate_python(alerts)
 
         return AlertListResponse(
             alerts=alert_responses,
             total_count=total_count,
             page=page,
             page_size=page_size,
+            next_before_id=next_before_id,
         )
 
     except Exception as e:
@@ -92,9 +92,7 @@ async def get_nearby_alerts(
             limit=limit,
             status=AlertStatusEnum.ACTIVE,
         )
-        return [
-            AlertResponse.model_validate(alert) for alert in alerts
-        ]
+        return type_adapter(List[AlertResponse]).validate_python(alerts)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -113,8 +111,7 @@ async def get_alert(
         alert = await alerts_service.get_alert_by_id(alert_id, db)
         if not alert:
             raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND, 
-                detail="Alert not found"
+                status_code=status.HTTP_404_NOT_FOUND, detail="Alert not found"
             )
 
         return AlertResponse.model_validate(alert)
@@ -132,6 +129,7 @@ async def get_alert(
 async def get_all_alerts_admin(
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    before_id: Optional[int] = Query(None, ge=1),
     alert_type: Optional[AlertTypeEnum] = Query(None),
     status_filter: Optional[AlertStatusEnum] = Query(None),
     current_admin: User = Depends(get_current_admin_user),
@@ -139,23 +137,23 @@ async def get_all_alerts_admin(
 ):
     """Get all alerts for admin dashboard with filtering and pagination."""
     try:
-        alerts, total_count = await alerts_service.get_all_alerts(
+        alerts, total_count, next_before_id = await alerts_service.get_all_alerts(
             page=page,
             page_size=page_size,
             alert_type=alert_type,
             status=status_filter,
             db=db,
+            before_id=before_id,
         )
 
-        alert_responses = [
-            AlertResponse.model_validate(alert) for alert in alerts
-        ]
+        alert_responses = type_adapter(List[AlertResponse]).validate_python(alerts)
 
         return AlertListResponse(
             alerts=alert_responses,
             total_count=total_count,
             page=page,
             page_size=page_size,
+            next_before_id=next_before_id,
         )
 
     except Exception as e:
@@ -173,13 +171,10 @@ async def resolve_alert(
 ):
     """Mark an alert as resolved (admin only)."""
     try:
-        alert = await alerts_service.resolve_alert(
-            alert_id, current_admin.id, db
-        )
+        alert = await alerts_service.resolve_alert(alert_id, current_admin.id, db)
         if not alert:
             raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND, 
-                detail="Alert not found"
+                status_code=status.HTTP_404_NOT_FOUND, detail="Alert not found"
             )
 
         return AlertResponse.model_validate(alert)
@@ -205,4 +200,4 @@ async def get_admin_alert_stats(
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to fetch alert statistics: {str(e)}",
-        )
\ No newline at end of file
+        )
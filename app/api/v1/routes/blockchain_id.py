@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import StreamingResponse
 from typing import Optional
 from sqlmodel import Session
 
@@ -7,16 +8,19 @@ from app.models.schemas.blockchain_id import (
     BlockchainApplicationRequest,
     ApplicationSearchQuery,
     ApplicationListResponse,
+    BlockchainApplicationResponse,
     BlockchainIDIssueRequest,
     BlockchainStatistics,
     APIResponse,
 )
+from app.models.database.base import engine
 from app.models.database.user import User
 from app.models.database.blockchain_id import BlockchainApplicationStatusEnum
 from app.services.blockchain_id import (
     apply_for_blockchain_id,
     search_applications,
     get_all_applications,
+    stream_applications,
     issue_blockchain_id,
     reject_application,
     get_blockchain_statistics,
@@ -77,8 +81,12 @@ async def apply_for_blockchain_tourist_id(
 async def get_blockchain_applications(
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
-    status: Optional[BlockchainApplicationStatusEnum] = Query(
-        None, description="Filter by status"
+    # Aliased so the parameter does not shadow fastapi.status in the handlers
+    status_filter: Optional[BlockchainApplicationStatusEnum] = Query(
+        None, alias="status", description="Filter by status"
+    ),
+    cursor: Optional[str] = Query(
+        None, description="next_cursor from the previous page (overrides page)"
     ),
     current_admin: User = Depends(get_current_admin_user),
     db: Session = Depends(get_db),
@@ -89,11 +97,16 @@ async def get_blockchain_applications(
     - **page**: Page number (starts from 1)
     - **page_size**: Number of applications per page (max 100)
     - **status**: Optional status filter (pending, issued, rejected)
+    - **cursor**: Keyset cursor from a previous response; faster than deep pages
     - Returns applications with user information
     """
     try:
-        applications, total_count = await get_all_applications(
-            page=page, page_size=page_size, status=status, db=db
+        applications, total_count, next_cursor = await get_all_applications(
+            page=page,
+            page_size=page_size,
+            status=status_filter,
+            db=db,
+            cursor=cursor,
         )
 
         return ApplicationListResponse(
@@ -101,6 +114,13 @@ async def get_blockchain_applications(
             total_count=total_count,
             page=page,
             page_size=page_size,
+            next_cursor=next_cursor,
+        )
+
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
         )
 
     except Exception as e:
@@ -115,6 +135,9 @@ async def search_blockchain_applications(
     search_query: ApplicationSearchQuery,
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(
+        None, description="next_cursor from the previous page (overrides page)"
+    ),
     current_admin: User = Depends(get_current_admin_user),
     db: Session = Depends(get_db),
 ):
@@ -125,11 +148,15 @@ async def search_blockchain_applications(
     - **status**: Filter by application status
     - **date_from**: Filter applications from this date
     - **date_to**: Filter applications up to this date
-    - Supports pagination
+    - Supports page or keyset (cursor) pagination
     """
     try:
-        applications, total_count = await search_applications(
-            search_query=search_query, page=page, page_size=page_size, db=db
+        applications, total_count, next_cursor = await search_applications(
+            search_query=search_query,
+            page=page,
+            page_size=page_size,
+            db=db,
+            cursor=cursor,
         )
 
         return ApplicationListResponse(
@@ -137,6 +164,13 @@ async def search_blockchain_applications(
             total_count=total_count,
             page=page,
             page_size=page_size,
+            next_cursor=next_cursor,
+        )
+
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
         )
 
     except Exception as e:
@@ -146,6 +180,31 @@ async def search_blockchain_applications(
         )
 
 
+@router.post("/applications/export")
+async def export_blockchain_applications(
+    search_query: ApplicationSearchQuery,
+    current_admin: User = Depends(get_current_admin_user),
+):
+    """
+    Admin exports every matching blockchain ID application as NDJSON.
+
+    - Accepts the same filters as /applications/search
+    - One application per line, newest first
+    - Rows are streamed in batches, so memory stays flat for large exports
+    """
+
+    def export_lines():
+        # Own session: the request-scoped one may be closed before the body streams
+        with Session(engine) as export_db:
+            for application in stream_applications(search_query, export_db):
+                yield (
+                    BlockchainApplicationResponse(**application).model_dump_json()
+                    + "\n"
+                )
+
+    return StreamingResponse(export_lines(), media_type="application/x-ndjson")
+
+
 @router.post("/applications/{application_id}/issue", response_model=APIResponse)
 async def issue_blockchain_tourist_id(
     application_id: int,
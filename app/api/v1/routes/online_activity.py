@@ -12,6 +12,7 @@ from app.models.schemas.online_activity import (
     OnlineActivityListResponse,
 )
 from app.services import online_activity as online_activity_service
+from app.utils.validation import type_adapter
 
 router = APIRouter(prefix="/online-activities", tags=["online_activities"])
 
@@ -50,9 +51,9 @@ async def get_online_activities(
             search_query=search_query, page=page, page_size=page_size, db=db
         )
 
-        activity_responses = [
-            OnlineActivityResponse.model_validate(activity) for activity in activities
-        ]
+        activity_responses = type_adapter(List[OnlineActivityResponse]).validate_python(
+            activities
+        )
 
         return OnlineActivityListResponse(
             online_activities=activity_responses,
@@ -86,9 +87,7 @@ async def search_online_activities_nearby(
             db=db,
             limit=limit,
         )
-        return [
-            OnlineActivityResponse.model_validate(activity) for activity in activities
-        ]
+        return type_adapter(List[OnlineActivityResponse]).validate_python(activities)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -113,9 +112,9 @@ async def search_online_activities_endpoint(
             search_query=search_query, page=page, page_size=page_size, db=db
         )
 
-        activity_responses = [
-            OnlineActivityResponse.model_validate(activity) for activity in activities
-        ]
+        activity_responses = type_adapter(List[OnlineActivityResponse]).validate_python(
+            activities
+        )
 
         return OnlineActivityListResponse(
             online_activities=activity_responses,
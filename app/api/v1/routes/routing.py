@@ -101,7 +101,9 @@ async def test_route_with_geofencing(
                 },
                 "total_blocked_areas": len(blocked_areas),
                 "route_found": bool(route_data),
-                "route_coordinates_count": len(summary.get("coordinates", [])),
+                "route_coordinates_count": len(
+                    (summary.get("geometry") or {}).get("coordinates", [])
+                ),
             },
         }
 
@@ -173,7 +175,9 @@ async def test_route_simple(
             },
             "debug": {
                 "blocked_areas_count": len(blocked_areas),
-                "route_points_count": len(summary.get("coordinates", [])),
+                "route_points_count": len(
+                    (summary.get("geometry") or {}).get("coordinates", [])
+                ),
                 "graphhopper_payload_sent": {
                     "profile": request.profile,
                     "points": [
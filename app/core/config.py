@@ -25,6 +25,10 @@ class Settings(BaseSettings):
     api_v1_prefix: str = "/api/v1"
 
     database_url: str = f"postgresql://{postgres_user}:{postgres_password}@{postgres_host}:{postgres_port}/{postgres_db}"
+    db_pool_size: int = int(os.environ.get("DB_POOL_SIZE", 10))
+    db_max_overflow: int = int(os.environ.get("DB_MAX_OVERFLOW", 20))
+    db_pool_recycle: int = int(os.environ.get("DB_POOL_RECYCLE", 3600))
+    db_query_cache_size: int = int(os.environ.get("DB_QUERY_CACHE_SIZE", 1200))
 
     jwt_secret_key: str = os.environ.get("JWT_SECRET_KEY", "your_secret_key")
     jwt_algorithm: str = os.environ.get("JWT_ALGORITHM", "HS256")
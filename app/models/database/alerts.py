@@ -3,7 +3,7 @@ from enum import Enum as PyEnum
 from typing import Optional, Any
 import datetime
 from geoalchemy2 import Geometry
-from sqlalchemy import Column
+from sqlalchemy import Column, Index
 
 
 class AlertTypeEnum(str, PyEnum):
@@ -22,6 +22,17 @@ class AlertStatusEnum(str, PyEnum):
 
 class Alert(SQLModel, table=True):
     __tablename__ = "alerts"
+    __table_args__ = (
+        # Covers status/type filters and stats counts as index-only scans
+        Index(
+            "ix_alerts_status_alert_type",
+            "status",
+            "alert_type",
+            postgresql_include=["id"],
+        ),
+        # Newest-first keyset pages within a status filter
+        Index("ix_alerts_status_id", "status", "id"),
+    )
 
     model_config = {"arbitrary_types_allowed": True}
 
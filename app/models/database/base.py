@@ -1,7 +1,17 @@
 from sqlmodel import create_engine, Session, SQLModel
 from app.core.config import settings
 
-engine = create_engine(settings.database_url, plugins=["geoalchemy2"])
+engine = create_engine(
+    settings.database_url,
+    plugins=["geoalchemy2"],
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    # Drop connections the server or a proxy may have silently closed
+    pool_recycle=settings.db_pool_recycle,
+    pool_pre_ping=True,
+    # Room for every hot statement shape so none are recompiled after eviction
+    query_cache_size=settings.db_query_cache_size,
+)
 
 
 def get_db():
@@ -1,3 +1,4 @@
+from sqlalchemy import DDL, Index, Sequence, event, text
 from sqlmodel import SQLModel, Field, Relationship
 from datetime import datetime
 from typing import Optional
@@ -6,14 +7,52 @@ from enum import Enum
 
 class BlockchainApplicationStatusEnum(str, Enum):
     PENDING = "pending"
+    ISSUING = "issuing"  # Claimed by an admin; blockchain transaction in flight
     ISSUED = "issued"
     REJECTED = "rejected"
 
 
+ACTIVE_APPLICATION_INDEX = "uq_blockchain_applications_active_user"
+
+# Numbers application_number values; unique across users and retries
+APPLICATION_NUMBER_SEQUENCE = Sequence(
+    "blockchain_application_number_seq", metadata=SQLModel.metadata
+)
+
+
 class BlockchainApplication(SQLModel, table=True):
     """Applications for blockchain ID issuance using itinerary ID"""
 
     __tablename__ = "blockchain_applications"
+    __table_args__ = (
+        # Newest-first listing and (applied_at, id) keyset pagination
+        Index("ix_blockchain_applications_applied_at_id", "applied_at", "id"),
+        # Status-filtered newest-first listing, covering for counts and list columns
+        Index(
+            "ix_blockchain_applications_status_applied_desc",
+            "status",
+            text("applied_at DESC"),
+            text("id DESC"),
+            postgresql_include=["application_number", "user_id", "itinerary_id"],
+        ),
+        Index("ix_blockchain_applications_issued_at", "issued_at"),
+        # Admin search by pasted user id
+        Index("ix_blockchain_applications_user_id", "user_id"),
+        # Trigram GIN index so the admin ILIKE '%...%' search can use an index
+        Index(
+            "ix_blockchain_applications_application_number_trgm",
+            "application_number",
+            postgresql_using="gin",
+            postgresql_ops={"application_number": "gin_trgm_ops"},
+        ),
+        # At most one pending, issuing or issued application per user
+        Index(
+            ACTIVE_APPLICATION_INDEX,
+            "user_id",
+            unique=True,
+            postgresql_where=text("status IN ('PENDING', 'ISSUING', 'ISSUED')"),
+        ),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     application_number: str = Field(..., unique=True, max_length=50)  # Auto-generated
@@ -36,10 +75,20 @@ class BlockchainApplication(SQLModel, table=True):
     blockchain_id: Optional["BlockchainID"] = Relationship(back_populates="application")
 
 
+# gin_trgm_ops needs pg_trgm before create_all builds the table's indexes
+event.listen(
+    BlockchainApplication.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm"),
+)
+
+
 class BlockchainID(SQLModel, table=True):
     """Issued blockchain IDs"""
 
     __tablename__ = "blockchain_ids"
+    # Admin search by pasted transaction hash
+    __table_args__ = (Index("ix_blockchain_ids_transaction_hash", "transaction_hash"),)
 
     id: Optional[int] = Field(default=None, primary_key=True)
     blockchain_id: str = Field(..., unique=True, max_length=100)  # Unique blockchain ID
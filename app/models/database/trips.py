@@ -1,4 +1,5 @@
 from sqlmodel import Field, SQLModel
+from sqlalchemy import Index, text
 import datetime
 from enum import Enum as PyEnum
 from typing import Optional
@@ -13,6 +14,10 @@ class TripStatusEnum(str, PyEnum):
 
 class Trips(SQLModel, table=True):
     __tablename__ = "trips"
+    __table_args__ = (
+        # Partial index: live-tracking queries only ever scan ongoing trips
+        Index("ix_trips_ongoing", "id", postgresql_where=text("status = 'ONGOING'")),
+    )
 
     id: int = Field(default=None, primary_key=True, index=True)
     user_id: int = Field(foreign_key="users.id", index=True)
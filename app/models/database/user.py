@@ -25,6 +25,8 @@ class User(SQLModel, table=True):
     aadhar_number_hash: Optional[str] = Field(default=None)
     passport_number_hash: Optional[str] = Field(default=None)
     blockchain_address: Optional[str] = Field(default=None)
+    # Set while an entry-point blockchain ID issuance is in flight
+    blockchain_issuing_since: Optional[datetime.datetime] = Field(default=None)
     is_kyc_verified: bool = Field(default=False)
     is_email_verified: bool = Field(default=False)
     is_active: bool = Field(default=True)
@@ -1,12 +1,13 @@
 from pydantic import BaseModel, Field
+from app.models.schemas.types import InternedStr
 from typing import Optional
 
 
 class AccommodationBase(BaseModel):
     name: str = Field(..., min_length=1, max_length=200)
     address: str = Field(..., min_length=1, max_length=500)
-    city: str = Field(..., min_length=1, max_length=100)
-    state: str = Field(..., min_length=1, max_length=100)
+    city: InternedStr = Field(..., min_length=1, max_length=100)
+    state: InternedStr = Field(..., min_length=1, max_length=100)
     postal_code: str = Field(..., min_length=1, max_length=20)
     latitude: float = Field(..., ge=-90, le=90)
     longitude: float = Field(..., ge=-180, le=180)
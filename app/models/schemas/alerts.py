@@ -41,6 +41,8 @@ class AlertListResponse(BaseModel):
     total_count: int
     page: int
     page_size: int
+    # Pass as before_id to fetch the next page; None when this page is the last
+    next_before_id: Optional[int] = None
 
 
 class AlertStatsResponse(BaseModel):
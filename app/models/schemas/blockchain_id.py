@@ -66,6 +66,8 @@ class ApplicationListResponse(BaseModel):
     total_count: int
     page: int
     page_size: int
+    # Pass back as cursor to fetch the next page; None on the last page
+    next_cursor: Optional[str] = None
 
 
 # Statistics
@@ -1,5 +1,6 @@
 # Renamed from treks.py
 from pydantic import BaseModel, Field
+from app.models.schemas.types import InternedStr
 from datetime import datetime
 from app.models.database.offline_activity import DifficultyLevelEnum
 from typing import Optional, List, Tuple
@@ -10,13 +11,13 @@ class OfflineActivityBase(BaseModel):
     description: Optional[str] = Field(None, max_length=1000)
     latitude: float = Field(..., ge=-90, le=90)
     longitude: float = Field(..., ge=-180, le=180)
-    city: str = Field(..., min_length=1, max_length=100)
-    district: str = Field(..., min_length=1, max_length=100)
-    state: str = Field(..., min_length=1, max_length=100)
+    city: InternedStr = Field(..., min_length=1, max_length=100)
+    district: InternedStr = Field(..., min_length=1, max_length=100)
+    state: InternedStr = Field(..., min_length=1, max_length=100)
     duration: Optional[int] = Field(None, ge=1)  # duration in hours
     altitude: Optional[int] = Field(None, ge=0)  # in meters
     nearest_town: Optional[str] = Field(None, max_length=100)
-    best_season: Optional[str] = Field(None, max_length=100)
+    best_season: Optional[InternedStr] = Field(None, max_length=100)
     permits_required: Optional[str] = Field(None, max_length=500)
     equipment_needed: Optional[str] = Field(None, max_length=500)
     safety_tips: Optional[str] = Field(None, max_length=1000)
@@ -1,5 +1,6 @@
 # Renamed from places.py
 from pydantic import BaseModel, Field
+from app.models.schemas.types import InternedStr
 from typing import Optional
 from datetime import datetime, time
 from app.models.database.online_activity import OnlineActivityTypeEnum
@@ -9,8 +10,8 @@ class OnlineActivityBase(BaseModel):
     name: str = Field(..., min_length=1, max_length=200)
     description: Optional[str] = Field(None, max_length=1000)
     place_type: OnlineActivityTypeEnum
-    city: str = Field(..., min_length=1, max_length=100)
-    state: str = Field(..., min_length=1, max_length=100)
+    city: InternedStr = Field(..., min_length=1, max_length=100)
+    state: InternedStr = Field(..., min_length=1, max_length=100)
     address: Optional[str] = Field(None, max_length=500)
     latitude: float = Field(..., ge=-90, le=90)
     longitude: float = Field(..., ge=-180, le=180)
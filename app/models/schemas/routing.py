@@ -1,5 +1,6 @@
-from pydantic import BaseModel, Field
-from typing import List, Dict, Any, Optional
+from pydantic import BaseModel, ConfigDict, Field, computed_field
+from typing import List, Dict, Any, Optional, Tuple
+from typing_extensions import TypedDict
 
 
 class RoutingTestRequest(BaseModel):
@@ -15,9 +16,36 @@ class GeoJSONGeometry(BaseModel):
     coordinates: List[List[float]]
 
 
+class RouteInstruction(TypedDict, total=False):
+    # GraphHopper adds more keys (sign, street_name, heading, ...); keep them as-is
+    __pydantic_config__ = ConfigDict(extra="allow")
+
+    text: str
+    distance: float
+    time: int
+    interval: Tuple[int, int]
+
+
+class RouteSummary(BaseModel):
+    distance_meters: float = 0
+    distance_km: float = 0
+    time_seconds: int = 0
+    time_minutes: float = 0
+    time_hours: float = 0
+    geometry: Optional[GeoJSONGeometry] = None
+    instructions: List[RouteInstruction] = []
+    bbox: Optional[Tuple[float, float, float, float]] = None
+
+    @computed_field
+    @property
+    def coordinates(self) -> List[List[float]]:
+        """Raw route coordinates, kept for backward compatibility."""
+        return self.geometry.coordinates if self.geometry else []
+
+
 class RoutingTestResponse(BaseModel):
     geojson: Dict[str, Any]
-    route_summary: Dict[str, Any]
+    route_summary: RouteSummary
     blocked_areas_count: int
     blocked_areas: List[str]
     request_details: Dict[str, Any]
@@ -0,0 +1,7 @@
+import sys
+from typing import Annotated
+from pydantic import AfterValidator
+
+# Low-cardinality strings (city, state, season) repeated across list responses;
+# interning keeps one shared str object per distinct value.
+InternedStr = Annotated[str, AfterValidator(sys.intern)]
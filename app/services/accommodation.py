@@ -1,8 +1,8 @@
 from sqlmodel import Session, select
 from app.models.database.accommodation import Accommodation
+from sqlalchemy import func, or_, update
 from typing import Optional, List, Tuple, Dict, Any
-import math
-from geoalchemy2.shape import to_shape
+from app.utils.geo import lat_lng_columns, make_point, within_radius
 from app.models.schemas.accommodation import (
     AccommodationCreate,
     AccommodationUpdate,
@@ -10,21 +10,13 @@ from app.models.schemas.accommodation import (
 )
 
 
-def _serialize_geometry_to_lat_lng(accommodation: Accommodation) -> Dict[str, Any]:
-    """Convert Accommodation with geometry to dict with latitude/longitude."""
+def _serialize_with_coordinates(
+    accommodation: Accommodation, latitude: Optional[float], longitude: Optional[float]
+) -> Dict[str, Any]:
+    """Convert Accommodation to dict using latitude/longitude selected in SQL."""
     accommodation_data = accommodation.dict()
-
-    if hasattr(accommodation, "location") and accommodation.location:
-        try:
-            point = to_shape(accommodation.location)
-            accommodation_data["latitude"] = point.y
-            accommodation_data["longitude"] = point.x
-        except Exception:
-            accommodation_data["latitude"] = None
-            accommodation_data["longitude"] = None
-    else:
-        accommodation_data["latitude"] = None
-        accommodation_data["longitude"] = None
+    accommodation_data["latitude"] = latitude
+    accommodation_data["longitude"] = longitude
     return accommodation_data
 
 
@@ -36,9 +28,7 @@ async def create_accommodation(
         data = accommodation_data.model_dump()
         latitude = data.pop("latitude")
         longitude = data.pop("longitude")
-        # WKT format: POINT(longitude latitude)
-        wkt_point = f"POINT({longitude} {latitude})"
-        data["location"] = wkt_point
+        data["location"] = make_point(latitude, longitude)
 
         accommodation = Accommodation(**data)
 
@@ -46,7 +36,7 @@ async def create_accommodation(
         db.commit()
         db.refresh(accommodation)
 
-        return _serialize_geometry_to_lat_lng(accommodation)
+        return _serialize_with_coordinates(accommodation, latitude, longitude)
     except Exception as e:
         db.rollback()
         raise e
@@ -56,19 +46,20 @@ async def get_accommodation_by_id(
     accommodation_id: int, db: Session
 ) -> Optional[Dict[str, Any]]:
     """Get an accommodation by ID."""
-    statement = select(Accommodation).where(Accommodation.id == accommodation_id)
-    accommodation = db.exec(statement).first()
-    if not accommodation:
+    statement = select(Accommodation, *lat_lng_columns(Accommodation.location)).where(
+        Accommodation.id == accommodation_id
+    )
+    row = db.exec(statement).first()
+    if not row:
         return None
-    return _serialize_geometry_to_lat_lng(accommodation)
+    return _serialize_with_coordinates(*row)
 
 
 async def _get_accommodation_raw_by_id(
     accommodation_id: int, db: Session
 ) -> Optional[Accommodation]:
     """Get raw Accommodation object without serialization - for internal use only."""
-    statement = select(Accommodation).where(Accommodation.id == accommodation_id)
-    return db.exec(statement).first()
+    return db.get(Accommodation, accommodation_id)
 
 
 async def update_accommodation(
@@ -76,10 +67,6 @@ async def update_accommodation(
 ) -> Optional[Dict[str, Any]]:
     """Update an accommodation."""
     try:
-        accommodation = await _get_accommodation_raw_by_id(accommodation_id, db)
-        if not accommodation:
-            return None
-
         update_dict = update_data.model_dump(exclude_unset=True)
 
         # Handle latitude/longitude conversion to geometry if present
@@ -87,21 +74,28 @@ async def update_accommodation(
             latitude = update_dict.pop("latitude")
             longitude = update_dict.pop("longitude")
             if latitude is not None and longitude is not None:
-                wkt_point = f"POINT({longitude} {latitude})"
-                update_dict["location"] = wkt_point
+                update_dict["location"] = make_point(latitude, longitude)
         elif "latitude" in update_dict or "longitude" in update_dict:
             # Remove individual lat/lng fields if only one is provided
             update_dict.pop("latitude", None)
             update_dict.pop("longitude", None)
 
-        for field, value in update_dict.items():
-            setattr(accommodation, field, value)
-
-        db.add(accommodation)
+        if not update_dict:
+            return await get_accommodation_by_id(accommodation_id, db)
+
+        # Single UPDATE ... RETURNING instead of SELECT + UPDATE + refresh
+        statement = (
+            update(Accommodation)
+            .where(Accommodation.id == accommodation_id)
+            .values(**update_dict)
+            .returning(Accommodation, *lat_lng_columns(Accommodation.location))
+        )
+        row = db.execute(statement).first()
+        # Serialize before commit; commit expires the instance and would reload it
+        updated = _serialize_with_coordinates(*row) if row else None
         db.commit()
-        db.refresh(accommodation)
 
-        return _serialize_geometry_to_lat_lng(accommodation)
+        return updated
     except Exception as e:
         db.rollback()
         raise e
@@ -123,27 +117,6 @@ async def delete_accommodation(accommodation_id: int, db: Session) -> bool:
         raise e
 
 
-def calculate_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
-    """Calculate distance between two points using Haversine formula."""
-    R = 6371  # Earth's radius in kilometers
-
-    lat1_rad = math.radians(lat1)
-    lon1_rad = math.radians(lon1)
-    lat2_rad = math.radians(lat2)
-    lon2_rad = math.radians(lon2)
-
-    dlat = lat2_rad - lat1_rad
-    dlon = lon2_rad - lon1_rad
-
-    a = (
-        math.sin(dlat / 2) ** 2
-        + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlon / 2) ** 2
-    )
-    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-
-    return R * c
-
-
 async def get_accommodations(
     db: Session,
     page: int = 1,
@@ -157,7 +130,7 @@ async def get_accommodations(
 ) -> Tuple[List[Dict[str, Any]], int]:
     """Get accommodations with optional filtering and pagination."""
     try:
-        statement = select(Accommodation)
+        statement = select(Accommodation, *lat_lng_columns(Accommodation.location))
 
         # Apply filters
         if name:
@@ -166,41 +139,26 @@ async def get_accommodations(
             statement = statement.where(Accommodation.city.ilike(f"%{city}%"))
         if state:
             statement = statement.where(Accommodation.state.ilike(f"%{state}%"))
-
-        # Execute query for counting and pagination
-        accommodations = db.exec(statement).all()
-
-        # Apply location-based filtering if coordinates provided
-        filtered_accommodations = []
         if latitude is not None and longitude is not None and radius_km is not None:
-            for accommodation in accommodations:
-                try:
-                    if accommodation.location:
-                        point = to_shape(accommodation.location)
-                        distance = calculate_distance(
-                            latitude, longitude, point.y, point.x
-                        )
-                        if distance <= radius_km:
-                            filtered_accommodations.append(accommodation)
-                except Exception:
-                    continue
-        else:
-            filtered_accommodations = accommodations
+            statement = statement.where(
+                within_radius(Accommodation.location, latitude, longitude, radius_km)
+            )
 
         # Count total results
-        total_count = len(filtered_accommodations)
+        total_count = db.exec(
+            select(func.count()).select_from(statement.subquery())
+        ).one()
 
-        # Apply pagination
-        start_index = (page - 1) * page_size
-        end_index = start_index + page_size
-        paginated_accommodations = filtered_accommodations[start_index:end_index]
+        # Apply pagination; a stable order keeps pages from overlapping
+        offset = (page - 1) * page_size
+        paginated_accommodations = db.exec(
+            statement.order_by(Accommodation.id).offset(offset).limit(page_size)
+        ).all()
 
         # Serialize accommodations
-        serialized_accommodations = []
-        for accommodation in paginated_accommodations:
-            serialized_accommodations.append(
-                _serialize_geometry_to_lat_lng(accommodation)
-            )
+        serialized_accommodations = [
+            _serialize_with_coordinates(*row) for row in paginated_accommodations
+        ]
 
         return serialized_accommodations, total_count
 
@@ -216,9 +174,7 @@ async def search_accommodations(
 ) -> Tuple[List[Dict[str, Any]], int]:
     """Search accommodations based on search criteria."""
     try:
-        from sqlalchemy import or_
-
-        statement = select(Accommodation)
+        statement = select(Accommodation, *lat_lng_columns(Accommodation.location))
 
         # Universal search across name, city, and state
         if search_query.query:
@@ -242,48 +198,35 @@ async def search_accommodations(
             statement = statement.where(
                 Accommodation.state.ilike(f"%{search_query.state}%")
             )
-
-        # Execute query for counting and pagination
-        accommodations = db.exec(statement).all()
-
-        # Apply location-based filtering if coordinates provided
-        filtered_accommodations = []
         if (
             search_query.latitude is not None
             and search_query.longitude is not None
             and search_query.radius_km is not None
         ):
-            for accommodation in accommodations:
-                try:
-                    if accommodation.location:
-                        point = to_shape(accommodation.location)
-                        distance = calculate_distance(
-                            search_query.latitude,
-                            search_query.longitude,
-                            point.y,
-                            point.x,
-                        )
-                        if distance <= search_query.radius_km:
-                            filtered_accommodations.append(accommodation)
-                except Exception:
-                    continue
-        else:
-            filtered_accommodations = accommodations
+            statement = statement.where(
+                within_radius(
+                    Accommodation.location,
+                    search_query.latitude,
+                    search_query.longitude,
+                    search_query.radius_km,
+                )
+            )
 
         # Count total results
-        total_count = len(filtered_accommodations)
+        total_count = db.exec(
+            select(func.count()).select_from(statement.subquery())
+        ).one()
 
-        # Apply pagination
-        start_index = (page - 1) * page_size
-        end_index = start_index + page_size
-        paginated_accommodations = filtered_accommodations[start_index:end_index]
+        # Apply pagination; a stable order keeps pages from overlapping
+        offset = (page - 1) * page_size
+        paginated_accommodations = db.exec(
+            statement.order_by(Accommodation.id).offset(offset).limit(page_size)
+        ).all()
 
         # Serialize accommodations
-        serialized_accommodations = []
-        for accommodation in paginated_accommodations:
-            serialized_accommodations.append(
-                _serialize_geometry_to_lat_lng(accommodation)
-            )
+        serialized_accommodations = [
+            _serialize_with_coordinates(*row) for row in paginated_accommodations
+        ]
 
         return serialized_accommodations, total_count
 
@@ -5,12 +5,24 @@ from app.models.database.user import User
 from app.models.database.location_sharing import LocationSharing
 from typing import Sequence, List, Dict
 from geoalchemy2.functions import ST_X, ST_Y
-from app.utils.blockchain import TouristIDClient
+from app.utils.blockchain import get_tourist_id_client, kyc_payload
+from app.services import itinerary as itinerary_service
+from app.core.config import settings
+from eth_account import Account
+from sqlalchemy import or_, update
 from web3 import Web3
-import json
+import asyncio
 import datetime
+import traceback
+import warnings
+
+# An entry-point issuance claim older than this is treated as abandoned
+ENTRY_POINT_CLAIM_TTL = datetime.timedelta(minutes=10)
+
 # Admin Functions
 
+_entry_point_deprecation_warned = False
+
 
 async def issue_blockchain_id_at_entry_point(
     user_id: int, itinerary_id: int, validity_days: int, official_id: int, db: Session
@@ -25,99 +37,109 @@ async def issue_blockchain_id_at_entry_point(
     This should only be called after physical verification of documents.
     Automatically sets KYC verified to true when blockchain ID is issued.
     """
+    global _entry_point_deprecation_warned
+
+    claimed = False
+    minted = False
     try:
-        # Add deprecation warning
-        import warnings
-
-        warnings.warn(
-            "issue_blockchain_id_at_entry_point is deprecated. "
-            "Use the new blockchain ID application system instead.",
-            DeprecationWarning,
-            stacklevel=2,
-        )
+        # Warn once per process rather than on every call
+        if not _entry_point_deprecation_warned:
+            _entry_point_deprecation_warned = True
+            warnings.warn(
+                "issue_blockchain_id_at_entry_point is deprecated. "
+                "Use the new blockchain ID application system instead.",
+                DeprecationWarning,
+                stacklevel=2,
+            )
 
-        from app.services import itinerary as itinerary_service
+        # Claim the user for issuance and commit straight away, so a
+        # concurrent call fails fast instead of waiting on a row lock held
+        # across the chain call
+        claimed_at = datetime.datetime.utcnow()
+        claim = db.execute(
+            update(User)
+            .where(
+                User.id == user_id,
+                or_(
+                    User.blockchain_issuing_since.is_(None),
+                    User.blockchain_issuing_since < claimed_at - ENTRY_POINT_CLAIM_TTL,
+                ),
+            )
+            .values(blockchain_issuing_since=claimed_at)
+            .returning(User.id)
+        ).first()
+        if not claim:
+            if not db.get(User, user_id):
+                raise ValueError("User not found")
+            raise ValueError("A blockchain ID is already being issued for this user")
+        db.commit()
+        claimed = True
 
-        # Get the user
-        user = db.exec(select(User).where(User.id == user_id)).first()
-        if not user:
-            raise ValueError("User not found")
+        user = db.get(User, user_id)
 
         # KYC verification will be automatically set when blockchain ID is issued
 
-        # Get itinerary data for blockchain
-        itinerary_data = await itinerary_service.get_itinerary_for_blockchain(
-            itinerary_id=itinerary_id, db=db
+        # Validate blockchain configuration before starting any chain work
+        if (
+            not settings.owner_address
+            or not settings.private_key
+            or not settings.contract_address
+        ):
+            raise ValueError(
+                "Blockchain configuration missing. Please set OWNER_ADDRESS, PRIVATE_KEY, and CONTRACT_ADDRESS environment variables."
+            )
+
+        # Key generation and the RPC connection block, so run them in worker
+        # threads while the itinerary is loaded; none depend on each other
+        (
+            userblockchain_account,
+            blockchain_client,
+            itinerary_data,
+        ) = await asyncio.gather(
+            asyncio.to_thread(Account.create),
+            asyncio.to_thread(get_tourist_id_client),
+            itinerary_service.get_itinerary_for_blockchain(
+                itinerary_id=itinerary_id, db=db
+            ),
         )
 
         if not itinerary_data or itinerary_data.strip() == "":
             raise ValueError(f"Invalid itinerary data for itinerary_id {itinerary_id}")
 
-        # Create blockchain account for the user
-        web3 = Web3()
-        userblockchain_account = web3.eth.account.create()
         userblockchain_account_address = userblockchain_account.address
         userblockchain_account_private_key = userblockchain_account.key.hex()
 
         # Validate blockchain address
-        if not userblockchain_account_address or not web3.is_address(
+        if not userblockchain_account_address or not Web3.is_address(
             userblockchain_account_address
         ):
             raise ValueError("Failed to generate valid blockchain address")
 
-        # Initialize blockchain client and issue tourist ID
-        # Validate blockchain configuration first
-        from app.core.config import settings
-
-        if (
-            not settings.owner_address
-            or not settings.private_key
-            or not settings.contract_address
-        ):
-            raise ValueError(
-                "Blockchain configuration missing. Please set OWNER_ADDRESS, PRIVATE_KEY, and CONTRACT_ADDRESS environment variables."
-            )
-
-        blockchain_client = TouristIDClient()
-
         # Create KYC hash from user data - handle None values
-        kyc_data = {
-            "first_name": user.first_name or "",
-            "last_name": user.last_name or "",
-            "email": user.email or "",
-            "country_code": user.country_code or "",
-            "aadhar_hash": user.aadhar_number_hash or "",
-            "passport_hash": user.passport_number_hash or "",
-            "verified_by_official": official_id,
-        }
-        kyc_json = json.dumps(kyc_data, sort_keys=True)
-        if not kyc_json or kyc_json.strip() == "":
-            raise ValueError("Invalid KYC data - cannot generate hash")
+        kyc_hash = blockchain_client.keccak32(kyc_payload(user, official_id))
 
-        kyc_hash = blockchain_client.bytes32_from_text(kyc_json)
-        if not kyc_hash:
-            raise ValueError("Failed to generate KYC hash")
-
-        # Create itinerary hash
-        if not itinerary_data or itinerary_data.strip() == "":
-            raise ValueError("Invalid itinerary data - cannot generate hash")
-
-        itinerary_hash = blockchain_client.bytes32_from_text(itinerary_data)
-        if not itinerary_hash:
-            raise ValueError("Failed to generate itinerary hash")
+        # Create itinerary hash (itinerary_data was validated above)
+        itinerary_hash = blockchain_client.keccak32(itinerary_data.encode())
 
         # Issue tourist ID with specified validity
         validity_seconds = validity_days * 24 * 3600
 
-        token_id, receipt = blockchain_client.issue_id(
+        # End the read transaction so nothing is held while the transaction is mined
+        db.commit()
+
+        token_id, receipt = await asyncio.to_thread(
+            blockchain_client.issue_id,
             tourist=userblockchain_account_address,
             kyc_hash_hex32=kyc_hash,
             itinerary_hash_hex32=itinerary_hash,
             validity_seconds=validity_seconds,
         )
+        minted = True
 
-        # Update user with blockchain information and automatically verify KYC
+        # Update user with blockchain information, release the claim and
+        # automatically verify KYC
         user.blockchain_address = userblockchain_account_address
+        user.blockchain_issuing_since = None
         user.is_kyc_verified = (
             True  # Automatically verify KYC when blockchain ID is issued
         )
@@ -133,9 +155,8 @@ async def issue_blockchain_id_at_entry_point(
 
         db.add(user)
         db.add(new_trip)
-        db.commit()
-        db.refresh(user)
-        db.refresh(new_trip)
+        # Flush (no commit) to get new_trip.id for the location sharing row
+        db.flush()
 
         # Create location sharing code for the new trip
         location_sharing = LocationSharing(
@@ -151,6 +172,7 @@ async def issue_blockchain_id_at_entry_point(
 
         db.add(location_sharing)
         db.commit()
+        db.refresh(new_trip)
         db.refresh(location_sharing)
 
         return {
@@ -171,12 +193,28 @@ async def issue_blockchain_id_at_entry_point(
         db.rollback()
         print(f"❌ Error in issue_blockchain_id_at_entry_point: {str(e)}")
         print(f"❌ Error type: {type(e).__name__}")
-        import traceback
-
         print(f"❌ Traceback: {traceback.format_exc()}")
+        if minted:
+            # Minted on chain but not recorded; the claim expires after
+            # ENTRY_POINT_CLAIM_TTL, which leaves time to reconcile first
+            print(f"❌ User {user_id} minted on chain but not recorded")
+        elif claimed:
+            _release_entry_point_claim(user_id, db)
         raise e
 
 
+def _release_entry_point_claim(user_id: int, db: Session) -> None:
+    """Clear a user's entry-point issuance claim after a failed issuance"""
+    try:
+        db.execute(
+            update(User).where(User.id == user_id).values(blockchain_issuing_since=None)
+        )
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Failed to release issuance claim for user {user_id}: {str(e)}")
+
+
 async def get_active_trips(db: Session) -> Sequence[Trips]:
     stmt = select(Trips).where(Trips.status == TripStatusEnum.ONGOING)
     trips = db.exec(stmt).all()
@@ -186,50 +224,57 @@ async def get_active_trips(db: Session) -> Sequence[Trips]:
 async def get_latest_location_all_trips(db: Session) -> List[Dict]:
     """Get the latest location for all ongoing trips"""
 
-    # Get all ongoing trips
-    ongoing_trips = db.exec(
-        select(Trips).where(Trips.status == TripStatusEnum.ONGOING)
+    # Latest fix per ongoing trip in one pass (DISTINCT ON trip_id)
+    latest_locations = (
+        select(
+            LocationHistory.trip_id,
+            ST_X(LocationHistory.location).label("longitude"),
+            ST_Y(LocationHistory.location).label("latitude"),
+            LocationHistory.timestamp,
+        )
+        .join(Trips, Trips.id == LocationHistory.trip_id)
+        .where(Trips.status == TripStatusEnum.ONGOING)
+        .distinct(LocationHistory.trip_id)
+        .order_by(LocationHistory.trip_id, desc(LocationHistory.timestamp))
+        .subquery()
+    )
+
+    # Outer join so trips without any location data are still listed
+    rows = db.exec(
+        select(
+            Trips.id,
+            Trips.user_id,
+            Trips.status,
+            Trips.tourist_id,
+            latest_locations.c.longitude,
+            latest_locations.c.latitude,
+            latest_locations.c.timestamp,
+        )
+        .outerjoin(latest_locations, latest_locations.c.trip_id == Trips.id)
+        .where(Trips.status == TripStatusEnum.ONGOING)
     ).all()
 
     trip_locations = []
 
-    for trip in ongoing_trips:
-        # Get the latest location for this trip
-        latest_location_query = db.exec(
-            select(
-                LocationHistory,
-                ST_X(LocationHistory.location).label("longitude"),
-                ST_Y(LocationHistory.location).label("latitude"),
-            )
-            .where(LocationHistory.trip_id == trip.id)
-            .order_by(desc(LocationHistory.timestamp))
-            .limit(1)
-        ).first()
-
-        if latest_location_query:
-            location_record, longitude, latitude = latest_location_query
-
-            trip_location = {
-                "trip_id": trip.id,
-                "user_id": trip.user_id,
-                "trip_status": trip.status,
-                "tourist_id": trip.tourist_id,
-                "latest_location": {
-                    "latitude": float(latitude),
-                    "longitude": float(longitude),
-                    "timestamp": location_record.timestamp,
-                },
+    for row in rows:
+        if row.timestamp is not None:
+            latest_location = {
+                "latitude": float(row.latitude),
+                "longitude": float(row.longitude),
+                "timestamp": row.timestamp,
             }
         else:
             # No location data available for this trip
-            trip_location = {
-                "trip_id": trip.id,
-                "user_id": trip.user_id,
-                "trip_status": trip.status,
-                "tourist_id": trip.tourist_id,
-                "latest_location": None,
+            latest_location = None
+
+        trip_locations.append(
+            {
+                "trip_id": row.id,
+                "user_id": row.user_id,
+                "trip_status": row.status,
+                "tourist_id": row.tourist_id,
+                "latest_location": latest_location,
             }
-
-        trip_locations.append(trip_location)
+        )
 
     return trip_locations
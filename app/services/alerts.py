@@ -1,31 +1,35 @@
 from sqlmodel import Session, select, func
+from sqlalchemy import update
 from app.models.database.alerts import Alert, AlertStatusEnum, AlertTypeEnum
 from app.models.schemas.alerts import (
     AlertCreate,
 )
 from typing import Optional, List, Tuple, Dict, Any
 import datetime
-import math
-from geoalchemy2.shape import to_shape
+from app.utils.geo import distance_order, lat_lng_columns, make_point, within_radius
+
+# Response fields only: rows come back as plain tuples, skipping ORM identity
+# map and instrumentation, with coordinates projected by PostGIS
+_ALERT_COLUMNS = (
+    Alert.id,
+    Alert.message,
+    Alert.alert_type,
+    Alert.status,
+    Alert.created_by,
+    Alert.created_at,
+    Alert.resolved_by,
+    Alert.resolved_at,
+    *lat_lng_columns(Alert.location),
+)
 
 
-def _serialize_geometry_to_lat_lng(alert: Alert) -> Dict[str, Any]:
-    """Convert Alert with geometry to dict with latitude/longitude."""
+def _serialize_with_coordinates(
+    alert: Alert, latitude: Optional[float], longitude: Optional[float]
+) -> Dict[str, Any]:
+    """Convert Alert to dict using latitude/longitude selected in SQL."""
     alert_data = alert.dict()
-
-    if hasattr(alert, "location") and alert.location:
-        try:
-            point = to_shape(alert.location)
-            alert_data["latitude"] = point.y
-            alert_data["longitude"] = point.x
-        except Exception:
-            alert_data["latitude"] = None
-            alert_data["longitude"] = None
-    else:
-        alert_data["latitude"] = None
-        alert_data["longitude"] = None
-
-    # Remove the geometry field from response
+    alert_data["latitude"] = latitude
+    alert_data["longitude"] = longitude
     alert_data.pop("location", None)
     return alert_data
 
@@ -40,10 +44,7 @@ async def create_alert(
         # Handle location
         latitude = data.pop("latitude")
         longitude = data.pop("longitude")
-
-        # WKT format: POINT(longitude latitude)
-        wkt_point = f"POINT({longitude} {latitude})"
-        data["location"] = wkt_point
+        data["location"] = make_point(latitude, longitude)
 
         alert = Alert(
             **data,
@@ -55,7 +56,7 @@ async def create_alert(
         db.commit()
         db.refresh(alert)
 
-        return _serialize_geometry_to_lat_lng(alert)
+        return _serialize_with_coordinates(alert, latitude, longitude)
     except Exception as e:
         db.rollback()
         raise e
@@ -64,13 +65,13 @@ async def create_alert(
 async def get_alert_by_id(alert_id: int, db: Session) -> Optional[Dict[str, Any]]:
     """Get an alert by ID."""
     try:
-        statement = select(Alert).where(Alert.id == alert_id)
-        alert = db.exec(statement).first()
+        statement = select(*_ALERT_COLUMNS).where(Alert.id == alert_id)
+        row = db.exec(statement).first()
 
-        if not alert:
+        if not row:
             return None
 
-        return _serialize_geometry_to_lat_lng(alert)
+        return dict(row._mapping)
     except Exception as e:
         raise e
 
@@ -80,57 +81,37 @@ async def resolve_alert(
 ) -> Optional[Dict[str, Any]]:
     """Mark an alert as resolved (admin only)."""
     try:
-        statement = select(Alert).where(Alert.id == alert_id)
-        alert = db.exec(statement).first()
-
-        if not alert:
-            return None
-
-        alert.status = AlertStatusEnum.RESOLVED
-        alert.resolved_by = admin_id
-        alert.resolved_at = datetime.datetime.now(datetime.timezone.utc)
-
-        db.add(alert)
+        # Single UPDATE ... RETURNING instead of SELECT + UPDATE + refresh
+        statement = (
+            update(Alert)
+            .where(Alert.id == alert_id)
+            .values(
+                status=AlertStatusEnum.RESOLVED,
+                resolved_by=admin_id,
+                resolved_at=datetime.datetime.now(datetime.timezone.utc),
+            )
+            .returning(*_ALERT_COLUMNS)
+        )
+        row = db.execute(statement).first()
         db.commit()
-        db.refresh(alert)
 
-        return _serialize_geometry_to_lat_lng(alert)
+        return dict(row._mapping) if row else None
     except Exception as e:
         db.rollback()
         raise e
 
 
-def calculate_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
-    """Calculate distance between two points using Haversine formula."""
-    R = 6371  # Earth's radius in kilometers
-
-    lat1_rad = math.radians(lat1)
-    lon1_rad = math.radians(lon1)
-    lat2_rad = math.radians(lat2)
-    lon2_rad = math.radians(lon2)
-
-    dlat = lat2_rad - lat1_rad
-    dlon = lon2_rad - lon1_rad
-
-    a = (
-        math.sin(dlat / 2) ** 2
-        + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlon / 2) ** 2
-    )
-    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-
-    return R * c
-
-
 async def get_all_alerts(
     page: int = 1,
     page_size: int = 20,
     alert_type: Optional[AlertTypeEnum] = None,
     status: Optional[AlertStatusEnum] = None,
     db: Session = None,
-) -> Tuple[List[Dict[str, Any]], int]:
-    """Get all alerts with filtering and pagination."""
+    before_id: Optional[int] = None,
+) -> Tuple[List[Dict[str, Any]], int, Optional[int]]:
+    """Get all alerts, newest first, with filtering and page or keyset pagination."""
     try:
-        statement = select(Alert)
+        statement = select(*_ALERT_COLUMNS)
 
         # Apply filters
         if alert_type:
@@ -140,18 +121,28 @@ async def get_all_alerts(
             statement = statement.where(Alert.status == status)
 
         # Get total count
-        all_alerts = db.exec(statement).all()
-        total_count = len(all_alerts)
-
-        # Apply pagination
-        offset = (page - 1) * page_size
-        paginated_statement = statement.offset(offset).limit(page_size)
+        total_count = db.exec(
+            select(func.count()).select_from(statement.subquery())
+        ).one()
+
+        # Keyset pagination seeks past before_id instead of scanning skipped rows
+        # One extra row says whether another page exists
+        paginated_statement = statement.order_by(Alert.id.desc()).limit(page_size + 1)
+        if before_id is not None:
+            paginated_statement = paginated_statement.where(Alert.id < before_id)
+        else:
+            paginated_statement = paginated_statement.offset((page - 1) * page_size)
         alerts = db.exec(paginated_statement).all()
 
+        next_before_id = None
+        if len(alerts) > page_size:
+            alerts = alerts[:page_size]
+            next_before_id = alerts[-1].id
+
         # Serialize alerts
-        serialized_alerts = [_serialize_geometry_to_lat_lng(alert) for alert in alerts]
+        serialized_alerts = [dict(row._mapping) for row in alerts]
 
-        return serialized_alerts, total_count
+        return serialized_alerts, total_count, next_before_id
 
     except Exception as e:
         raise e
@@ -167,31 +158,20 @@ async def get_nearby_alerts(
 ) -> List[Dict[str, Any]]:
     """Get alerts within a radius of given coordinates."""
     try:
-        # Get alerts with optional status filter
-        statement = select(Alert)
+        # Nearest alerts first, filtered by radius in PostGIS
+        statement = select(*_ALERT_COLUMNS).where(
+            within_radius(Alert.location, latitude, longitude, radius_km)
+        )
         if status:
             statement = statement.where(Alert.status == status)
+        statement = statement.order_by(
+            distance_order(Alert.location, latitude, longitude)
+        ).limit(limit)
 
-        all_alerts = db.exec(statement).all()
-
-        # Filter by distance
-        nearby_alerts = []
-        for alert in all_alerts:
-            if hasattr(alert, "location") and alert.location:
-                try:
-                    point = to_shape(alert.location)
-                    distance = calculate_distance(latitude, longitude, point.y, point.x)
-                    if distance <= radius_km:
-                        nearby_alerts.append((alert, distance))
-                except Exception:
-                    continue
-
-        # Sort by distance and apply limit
-        nearby_alerts.sort(key=lambda x: x[1])
-        limited_alerts = nearby_alerts[:limit]
+        nearby_alerts = db.exec(statement).all()
 
         # Serialize results
-        return [_serialize_geometry_to_lat_lng(alert[0]) for alert in limited_alerts]
+        return [dict(row._mapping) for row in nearby_alerts]
 
     except Exception as e:
         raise e
@@ -200,29 +180,34 @@ async def get_nearby_alerts(
 async def get_admin_alert_stats(db: Session) -> Dict[str, Any]:
     """Get alert statistics for admin dashboard."""
     try:
-        # Total alerts
-        total_count = db.exec(select(func.count(Alert.id))).first()
-
-        # Active alerts
-        active_count = db.exec(
-            select(func.count(Alert.id)).where(Alert.status == AlertStatusEnum.ACTIVE)
-        ).first()
-
-        # Alerts by type
-        type_stats = {}
-        for alert_type in AlertTypeEnum:
-            count = db.exec(
-                select(func.count(Alert.id)).where(Alert.alert_type == alert_type)
-            ).first()
-            type_stats[alert_type.value] = count
-
-        # Alerts by status
-        status_stats = {}
-        for status in AlertStatusEnum:
-            count = db.exec(
-                select(func.count(Alert.id)).where(Alert.status == status)
-            ).first()
-            status_stats[status.value] = count
+        # Total plus per-type and per-status counts in a single scan
+        alert_types = list(AlertTypeEnum)
+        statuses = list(AlertStatusEnum)
+        counts = db.exec(
+            select(
+                func.count(Alert.id),
+                *(
+                    func.count(Alert.id).filter(Alert.alert_type == alert_type)
+                    for alert_type in alert_types
+                ),
+                *(
+                    func.count(Alert.id).filter(Alert.status == status)
+                    for status in statuses
+                ),
+            )
+        ).one()
+
+        total_count = counts[0]
+        type_counts = counts[1 : 1 + len(alert_types)]
+        status_counts = counts[1 + len(alert_types) :]
+        type_stats = {
+            alert_type.value: count
+            for alert_type, count in zip(alert_types, type_counts)
+        }
+        status_stats = {
+            status.value: count for status, count in zip(statuses, status_counts)
+        }
+        active_count = status_stats[AlertStatusEnum.ACTIVE.value]
 
         return {
             "total_alerts": total_count,
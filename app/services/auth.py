@@ -1,53 +1,33 @@
+import asyncio
+import secrets
+from sqlalchemy.exc import IntegrityError
 from sqlmodel import Session, select
 from app.models.database.user import User
 from app.models.schemas.auth import UserCreate, UserCreateResponse, UserResponse
 from app.utils.security import hash_password, hash_identifier, verify_password
 
+# Verified against when the email is unknown; matches no real password
+_DUMMY_HASH = hash_password(secrets.token_urlsafe(32))
+
 
 async def create_user(user_create_data: UserCreate, db: Session) -> UserCreateResponse:
     try:
-        existing_user_email = db.exec(
-            select(User).where(User.email == user_create_data.email)
-        ).first()
-        if existing_user_email:
-            raise ValueError(f"User with email {user_create_data.email} already exists")
-
-        existing_user_phone = db.exec(
-            select(User).where(User.phone_number == user_create_data.phone_number)
-        ).first()
-        if existing_user_phone:
-            raise ValueError(
-                f"User with phone number {user_create_data.phone_number} already exists"
-            )
-
-        if user_create_data.aadhar_number:
-            aadhar_hash_check = hash_identifier(user_create_data.aadhar_number)
-            existing_user_aadhar = db.exec(
-                select(User).where(User.aadhar_number_hash == aadhar_hash_check)
-            ).first()
-            if existing_user_aadhar:
-                raise ValueError("User with this Aadhar number already exists")
-
-        if user_create_data.passport_number:
-            passport_hash_check = hash_identifier(user_create_data.passport_number)
-            existing_user_passport = db.exec(
-                select(User).where(User.passport_number_hash == passport_hash_check)
-            ).first()
-            if existing_user_passport:
-                raise ValueError("User with this passport number already exists")
-
-        password_hash = hash_password(user_create_data.password)
+        # bcrypt is CPU-bound; keep it off the event loop
         aadhar_hash = (
-            hash_identifier(user_create_data.aadhar_number)
+            await asyncio.to_thread(hash_identifier, user_create_data.aadhar_number)
             if user_create_data.aadhar_number
             else None
         )
         passport_hash = (
-            hash_identifier(user_create_data.passport_number)
+            await asyncio.to_thread(hash_identifier, user_create_data.passport_number)
             if user_create_data.passport_number
             else None
         )
 
+        password_hash = await asyncio.to_thread(
+            hash_password, user_create_data.password
+        )
+
         user = User(
             first_name=user_create_data.first_name,
             middle_name=user_create_data.middle_name,
@@ -61,7 +41,20 @@ async def create_user(user_create_data: UserCreate, db: Session) -> UserCreateRe
             blockchain_address=None,
         )
         db.add(user)
-        db.commit()
+        try:
+            db.commit()
+        except IntegrityError as e:
+            db.rollback()
+            constraint = getattr(getattr(e.orig, "diag", None), "constraint_name", None)
+            if constraint == "ix_users_email":
+                raise ValueError(
+                    f"User with email {user_create_data.email} already exists"
+                )
+            if constraint == "ix_users_phone_number":
+                raise ValueError(
+                    f"User with phone number {user_create_data.phone_number} already exists"
+                )
+            raise e
         db.refresh(user)
 
         user_response = UserResponse.model_validate(user)
@@ -82,6 +75,11 @@ async def create_user(user_create_data: UserCreate, db: Session) -> UserCreateRe
 async def authenticate_user(email: str, password: str, db: Session) -> User | None:
     statement = select(User).where(User.email == email)
     user = db.exec(statement).first()
-    if user and verify_password(password, user.password_hash):
+    # Always run bcrypt, off the event loop, so unknown emails take as long as
+    # wrong passwords and cannot be told apart by response time
+    password_ok = await asyncio.to_thread(
+        verify_password, password, user.password_hash if user else _DUMMY_HASH
+    )
+    if user and password_ok:
         return user
     return None
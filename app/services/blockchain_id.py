@@ -1,12 +1,21 @@
+import asyncio
+import base64
+import hashlib
 import json
+import string
+import time
 import datetime
 from datetime import timedelta
 from typing import List, Dict, Any, Optional, Tuple
 from sqlmodel import Session, select, or_
-from sqlalchemy import func
+from sqlalchemy import String, cast, exists, func, insert, tuple_, update
+from sqlalchemy.exc import IntegrityError
+from eth_account import Account
 from web3 import Web3
 
 from app.models.database.blockchain_id import (
+    ACTIVE_APPLICATION_INDEX,
+    APPLICATION_NUMBER_SEQUENCE,
     BlockchainApplication,
     BlockchainID,
     BlockchainApplicationStatusEnum,
@@ -15,12 +24,57 @@ from app.models.schemas.blockchain_id import (
     BlockchainApplicationRequest,
     BlockchainIDIssueRequest,
     ApplicationSearchQuery,
+    BlockchainApplicationResponse,
     BlockchainStatistics,
 )
 from app.models.database.user import User
 from app.models.database.trips import Trips, TripStatusEnum
 from app.models.database.location_sharing import LocationSharing
-from app.utils.blockchain import TouristIDClient
+from app.utils.blockchain import get_tourist_id_client, kyc_payload
+from app.services import itinerary as itinerary_service
+from app.utils.pagination import cached_count, count_cache_key
+from app.core.config import settings
+
+
+# Dashboard statistics tolerate brief staleness; status changes invalidate them
+STATISTICS_CACHE_TTL_SECONDS = 30
+EXPORT_BATCH_SIZE = 500
+
+# Statuses covered by ACTIVE_APPLICATION_INDEX (one per user)
+_ACTIVE_STATUSES = (
+    BlockchainApplicationStatusEnum.PENDING,
+    BlockchainApplicationStatusEnum.ISSUING,
+    BlockchainApplicationStatusEnum.ISSUED,
+)
+
+# Application columns the list and export responses actually render
+_APPLICATION_RESPONSE_FIELDS = tuple(
+    name
+    for name in BlockchainApplicationResponse.model_fields
+    if name in BlockchainApplication.model_fields
+)
+
+# Projected list columns plus applicant info, labelled as the response fields
+_APPLICATION_COLUMNS = (
+    *(getattr(BlockchainApplication, name) for name in _APPLICATION_RESPONSE_FIELDS),
+    func.nullif(
+        func.concat_ws(
+            " ", func.nullif(User.first_name, ""), func.nullif(User.last_name, "")
+        ),
+        "",
+    ).label("user_name"),
+    User.email.label("user_email"),
+    User.phone_number.label("user_phone"),
+)
+
+# (expires_at, day, statistics) for this process
+_statistics_cache: Optional[Tuple[float, datetime.date, BlockchainStatistics]] = None
+
+
+def _invalidate_statistics_cache() -> None:
+    """Drop cached dashboard statistics after an application changes status"""
+    global _statistics_cache
+    _statistics_cache = None
 
 
 # Tourist applies for blockchain ID
@@ -29,48 +83,67 @@ async def apply_for_blockchain_id(
 ) -> Dict[str, Any]:
     """Tourist applies for blockchain ID using their itinerary ID"""
     try:
-        # Check if user already has a pending/issued application
-        existing_app = db.exec(
-            select(BlockchainApplication).where(
-                BlockchainApplication.user_id == user_id,
-                BlockchainApplication.status.in_(
-                    [
-                        BlockchainApplicationStatusEnum.PENDING,
-                        BlockchainApplicationStatusEnum.ISSUED,
-                    ]
-                ),
-            )
-        ).first()
-
-        if existing_app:
-            raise ValueError(
-                f"You already have an application with status: {existing_app.status}"
-            )
-
         # Verify itinerary exists and belongs to user (you'll need to add this check based on your itinerary model)
         # itinerary = db.exec(select(Itinerary).where(Itinerary.id == application_data.itinerary_id, Itinerary.user_id == user_id)).first()
         # if not itinerary:
         #     raise ValueError("Itinerary not found or doesn't belong to you")
 
-        # Generate application number
-        app_number = f"BID{datetime.datetime.utcnow().strftime('%Y%m%d')}{user_id:06d}"
-
-        # Create application
-        application = BlockchainApplication(
-            application_number=app_number,
-            user_id=user_id,
-            itinerary_id=application_data.itinerary_id,
-            status=BlockchainApplicationStatusEnum.PENDING,
-            applied_at=datetime.datetime.utcnow(),
+        # One timestamp for the whole request
+        now = datetime.datetime.utcnow()
+
+        # Insert with a sequence-backed application number and read the
+        # generated values back in the same round trip
+        statement = (
+            insert(BlockchainApplication)
+            .values(
+                application_number=func.concat(
+                    "BID",
+                    now.strftime("%Y%m%d"),
+                    func.lpad(
+                        cast(APPLICATION_NUMBER_SEQUENCE.next_value(), String), 8, "0"
+                    ),
+                ),
+                user_id=user_id,
+                itinerary_id=application_data.itinerary_id,
+                status=BlockchainApplicationStatusEnum.PENDING,
+                applied_at=now,
+            )
+            .returning(
+                BlockchainApplication.id,
+                BlockchainApplication.application_number,
+                BlockchainApplication.status,
+                BlockchainApplication.applied_at,
+            )
         )
 
-        db.add(application)
-        db.commit()
-        db.refresh(application)
+        try:
+            application = db.execute(statement).one()
+            db.commit()
+        except IntegrityError as e:
+            # The partial unique index allows one pending/issued application per
+            # user, so concurrent applies cannot both slip past a read-then-write
+            db.rollback()
+            if (
+                getattr(getattr(e.orig, "diag", None), "constraint_name", None)
+                != ACTIVE_APPLICATION_INDEX
+            ):
+                raise e
+            existing_status = db.exec(
+                select(BlockchainApplication.status)
+                .where(
+                    BlockchainApplication.user_id == user_id,
+                    BlockchainApplication.status.in_(_ACTIVE_STATUSES),
+                )
+                .limit(1)
+            ).first()
+            raise ValueError(
+                f"You already have an application with status: {existing_status}"
+            )
+        _invalidate_statistics_cache()
 
         return {
             "application_id": application.id,
-            "application_number": app_number,
+            "application_number": application.application_number,
             "status": application.status,
             "applied_at": application.applied_at,
             "message": "Application submitted successfully! You will be notified once it's processed by the admin.",
@@ -81,64 +154,133 @@ async def apply_for_blockchain_id(
         raise e
 
 
+def _universal_search_filter(query: str):
+    """Most selective indexed predicate for what the admin pasted"""
+    query = query.strip()
+    number_filter = BlockchainApplication.application_number.ilike(f"%{query}%")
+
+    # Application or user id; still matches digits inside application numbers
+    if query.isascii() and query.isdigit() and len(query) <= 10:
+        return or_(
+            BlockchainApplication.id == int(query),
+            BlockchainApplication.user_id == int(query),
+            number_filter,
+        )
+
+    # Transaction hash, with or without the 0x prefix (never in a number)
+    tx_hash = query[2:] if query[:2].lower() == "0x" else query
+    if len(tx_hash) == 64 and all(char in string.hexdigits for char in tx_hash):
+        tx_hash = tx_hash.lower()
+        return exists().where(
+            BlockchainID.application_id == BlockchainApplication.id,
+            BlockchainID.transaction_hash.in_((tx_hash, f"0x{tx_hash}")),
+        )
+
+    return number_filter
+
+
+def _apply_search_filters(statement, search_query: ApplicationSearchQuery):
+    """Apply admin search filters to a BlockchainApplication statement"""
+    # Universal search across application number, ids and transaction hash
+    if search_query.query:
+        statement = statement.where(_universal_search_filter(search_query.query))
+
+    # Specific filters
+    if search_query.status:
+        statement = statement.where(BlockchainApplication.status == search_query.status)
+
+    if search_query.date_from:
+        statement = statement.where(
+            BlockchainApplication.applied_at >= search_query.date_from
+        )
+
+    if search_query.date_to:
+        statement = statement.where(
+            BlockchainApplication.applied_at <= search_query.date_to
+        )
+
+    return statement
+
+
+def _encode_application_cursor(application: Any) -> str:
+    """Opaque cursor for the (applied_at, id) position of an application"""
+    payload = json.dumps(
+        {"applied_at": application.applied_at.isoformat(), "id": application.id}
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def _decode_application_cursor(cursor: str) -> Tuple[datetime.datetime, int]:
+    """Inverse of _encode_application_cursor; raises ValueError if malformed"""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.datetime.fromisoformat(payload["applied_at"]), int(
+            payload["id"]
+        )
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError("Invalid pagination cursor") from e
+
+
+def _select_applications():
+    """Projected application rows joined to their applicant, no ORM hydration"""
+    return select(*_APPLICATION_COLUMNS).outerjoin(
+        User, User.id == BlockchainApplication.user_id
+    )
+
+
+def _paginate_applications(
+    statement, page: int, page_size: int, cursor: Optional[str], db: Session
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """Newest-first page of applications; keyset seek when a cursor is given"""
+    statement = statement.order_by(
+        BlockchainApplication.applied_at.desc(), BlockchainApplication.id.desc()
+    ).limit(page_size + 1)  # one extra row says whether another page exists
+
+    if cursor:
+        # Seek past the last row seen instead of scanning and discarding OFFSET rows
+        statement = statement.where(
+            tuple_(BlockchainApplication.applied_at, BlockchainApplication.id)
+            < _decode_application_cursor(cursor)
+        )
+    else:
+        statement = statement.offset((page - 1) * page_size)
+
+    rows = db.exec(statement).all()
+    next_cursor = None
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        next_cursor = _encode_application_cursor(rows[-1])
+    return [dict(row._mapping) for row in rows], next_cursor
+
+
 # Admin searches applications
 async def search_applications(
     search_query: ApplicationSearchQuery,
     page: int = 1,
     page_size: int = 20,
     db: Session = None,
-) -> Tuple[List[Dict[str, Any]], int]:
+    cursor: Optional[str] = None,
+) -> Tuple[List[Dict[str, Any]], int, Optional[str]]:
     """Search blockchain applications for admin management"""
     try:
-        statement = select(BlockchainApplication)
-
-        # Universal search across application number and user info
-        if search_query.query:
-            # You'll need to join with User table to search user info
-            universal_filter = or_(
-                BlockchainApplication.application_number.ilike(
-                    f"%{search_query.query}%"
-                ),
-                # Add more search fields as needed
-            )
-            statement = statement.where(universal_filter)
-
-        # Specific filters
-        if search_query.status:
-            statement = statement.where(
-                BlockchainApplication.status == search_query.status
-            )
-
-        if search_query.date_from:
-            statement = statement.where(
-                BlockchainApplication.applied_at >= search_query.date_from
-            )
-
-        if search_query.date_to:
-            statement = statement.where(
-                BlockchainApplication.applied_at <= search_query.date_to
-            )
-
-        # Get total count
-        total_count = len(db.exec(statement).all())
-
-        # Apply pagination
-        offset = (page - 1) * page_size
-        statement = statement.offset(offset).limit(page_size)
-
-        applications = db.exec(statement).all()
+        # Count on the bare table; the applicant join only matters for the page
+        total_count = cached_count(
+            db,
+            _apply_search_filters(select(BlockchainApplication.id), search_query),
+            count_cache_key(
+                "blockchain_applications.search", **search_query.model_dump()
+            ),
+        )
 
-        # Format response (you'll need to add user info from User table)
-        result = []
-        for app in applications:
-            app_dict = app.model_dump()
-            # Add user info here:
-            # user = db.exec(select(User).where(User.id == app.user_id)).first()
-            # app_dict["user_name"] = user.name if user else "Unknown"
-            # app_dict["user_email"] = user.email if user else "Unknown"
-            result.append(app_dict)
+        result, next_cursor = _paginate_applications(
+            _apply_search_filters(_select_applications(), search_query),
+            page,
+            page_size,
+            cursor,
+            db,
+        )
 
-        return result, total_count
+        return result, total_count, next_cursor
 
     except Exception as e:
         raise e
@@ -150,40 +292,63 @@ async def get_all_applications(
     page_size: int = 20,
     status: Optional[BlockchainApplicationStatusEnum] = None,
     db: Session = None,
-) -> Tuple[List[Dict[str, Any]], int]:
+    cursor: Optional[str] = None,
+) -> Tuple[List[Dict[str, Any]], int, Optional[str]]:
     """Get all blockchain applications with optional status filter"""
     try:
-        statement = select(BlockchainApplication)
+        statement = _select_applications()
+        count_statement = select(BlockchainApplication.id)
 
         if status:
             statement = statement.where(BlockchainApplication.status == status)
+            count_statement = count_statement.where(
+                BlockchainApplication.status == status
+            )
 
-        # Order by newest first
-        statement = statement.order_by(BlockchainApplication.applied_at.desc())
+        # Count on the bare table; the applicant join only matters for the page
+        total_count = cached_count(
+            db,
+            count_statement,
+            count_cache_key("blockchain_applications.list", status=status),
+        )
 
-        # Get total count
-        total_count = len(db.exec(statement).all())
+        # Newest first
+        result, next_cursor = _paginate_applications(
+            statement, page, page_size, cursor, db
+        )
 
-        # Apply pagination
-        offset = (page - 1) * page_size
-        statement = statement.offset(offset).limit(page_size)
+        return result, total_count, next_cursor
 
-        applications = db.exec(statement).all()
+    except Exception as e:
+        raise e
 
-        # Format response (you'll need to add user info from User table)
-        result = []
-        for app in applications:
-            app_dict = app.model_dump()
-            # Add user info here:
-            # user = db.exec(select(User).where(User.id == app.user_id)).first()
-            # app_dict["user_name"] = user.name if user else "Unknown"
-            # app_dict["user_email"] = user.email if user else "Unknown"
-            result.append(app_dict)
 
-        return result, total_count
+# Admin exports applications
+def stream_applications(search_query: ApplicationSearchQuery, db: Session):
+    """Yield every matching application newest first, fetching rows in batches"""
+    statement = (
+        _apply_search_filters(_select_applications(), search_query)
+        .order_by(
+            BlockchainApplication.applied_at.desc(), BlockchainApplication.id.desc()
+        )
+        # Server-side cursor: only one batch of rows is held in memory at a time
+        .execution_options(yield_per=EXPORT_BATCH_SIZE)
+    )
 
-    except Exception as e:
-        raise e
+    for row in db.exec(statement):
+        yield dict(row._mapping)
+
+
+def _not_pending_error(application_id: int, db: Session) -> ValueError:
+    """Explain why a conditional update on a pending application matched nothing"""
+    current_status = db.exec(
+        select(BlockchainApplication.status).where(
+            BlockchainApplication.id == application_id
+        )
+    ).first()
+    if current_status is None:
+        return ValueError("Application not found")
+    return ValueError(f"Application is not pending. Current status: {current_status}")
 
 
 # Admin rejects application
@@ -195,35 +360,38 @@ async def reject_application(
 ) -> Dict[str, Any]:
     """Admin rejects a blockchain ID application"""
     try:
-        # Get application
-        application = db.exec(
-            select(BlockchainApplication).where(
-                BlockchainApplication.id == application_id
+        # Conditional UPDATE ... RETURNING: one round trip, and a concurrent
+        # reject or issue of the same application cannot both succeed
+        statement = (
+            update(BlockchainApplication)
+            .where(
+                BlockchainApplication.id == application_id,
+                BlockchainApplication.status == BlockchainApplicationStatusEnum.PENDING,
             )
-        ).first()
-
-        if not application:
-            raise ValueError("Application not found")
-
-        if application.status != BlockchainApplicationStatusEnum.PENDING:
-            raise ValueError(
-                f"Application is not pending. Current status: {application.status}"
+            .values(
+                status=BlockchainApplicationStatusEnum.REJECTED,
+                rejected_at=datetime.datetime.utcnow(),
+                processed_by_admin=admin_id,
+                admin_notes=admin_notes,
+            )
+            .returning(
+                BlockchainApplication.id,
+                BlockchainApplication.status,
+                BlockchainApplication.rejected_at,
             )
+        )
+        row = db.execute(statement).first()
 
-        # Update application
-        application.status = BlockchainApplicationStatusEnum.REJECTED
-        application.rejected_at = datetime.datetime.utcnow()
-        application.processed_by_admin = admin_id
-        application.admin_notes = admin_notes
+        if not row:
+            raise _not_pending_error(application_id, db)
 
-        db.add(application)
         db.commit()
-        db.refresh(application)
+        _invalidate_statistics_cache()
 
         return {
-            "application_id": application.id,
-            "status": application.status,
-            "rejected_at": application.rejected_at,
+            "application_id": row.id,
+            "status": row.status,
+            "rejected_at": row.rejected_at,
             "reason": admin_notes,
             "message": "Application rejected.",
         }
@@ -238,132 +406,137 @@ async def issue_blockchain_id(
     issue_request: BlockchainIDIssueRequest, admin_id: int, db: Session
 ) -> Dict[str, Any]:
     """Admin directly issues REAL blockchain ID from pending application with actual blockchain transaction"""
+    application_id = issue_request.application_id
+    claimed = False
+    minted = False
     try:
-        # Get application
-        application = db.exec(
-            select(BlockchainApplication).where(
-                BlockchainApplication.id == issue_request.application_id
+        # Initialize blockchain client and issue tourist ID
+        if (
+            not settings.owner_address
+            or not settings.private_key
+            or not settings.contract_address
+        ):
+            raise ValueError(
+                "Blockchain configuration missing. Please set OWNER_ADDRESS, PRIVATE_KEY, and CONTRACT_ADDRESS environment variables."
+            )
+
+        # Claim the application PENDING -> ISSUING and commit straight away, so
+        # a concurrent issue or reject fails instead of waiting on a row lock
+        # held across the chain call
+        claim = db.execute(
+            update(BlockchainApplication)
+            .where(
+                BlockchainApplication.id == application_id,
+                BlockchainApplication.status == BlockchainApplicationStatusEnum.PENDING,
+            )
+            .values(
+                status=BlockchainApplicationStatusEnum.ISSUING,
+                processed_by_admin=admin_id,
+            )
+            .returning(
+                BlockchainApplication.user_id, BlockchainApplication.itinerary_id
             )
         ).first()
 
-        if not application:
-            raise ValueError("Application not found")
+        if not claim:
+            raise _not_pending_error(application_id, db)
 
-        if application.status != BlockchainApplicationStatusEnum.PENDING:
-            raise ValueError(
-                f"Application not pending. Current status: {application.status}"
-            )
+        db.commit()
+        claimed = True
 
         # Check if blockchain ID already issued
-        existing_id = db.exec(
-            select(BlockchainID).where(BlockchainID.application_id == application.id)
-        ).first()
+        already_issued = db.exec(
+            select(exists().where(BlockchainID.application_id == application_id))
+        ).one()
 
-        if existing_id:
+        if already_issued:
             raise ValueError("Blockchain ID already issued for this application")
 
         # Get user details
-        user = db.exec(select(User).where(User.id == application.user_id)).first()
+        user = db.get(User, claim.user_id)
         if not user:
             raise ValueError("User not found")
 
-        # Get itinerary data for blockchain
-        from app.services import itinerary as itinerary_service
-
-        itinerary_data = await itinerary_service.get_itinerary_for_blockchain(
-            itinerary_id=application.itinerary_id, db=db
+        # Key generation and the RPC connection block, so run them in worker
+        # threads while the itinerary is loaded; none depend on each other
+        (
+            userblockchain_account,
+            blockchain_client,
+            itinerary_data,
+        ) = await asyncio.gather(
+            asyncio.to_thread(Account.create),
+            asyncio.to_thread(get_tourist_id_client),
+            itinerary_service.get_itinerary_for_blockchain(
+                itinerary_id=claim.itinerary_id, db=db
+            ),
         )
 
         if not itinerary_data or itinerary_data.strip() == "":
             raise ValueError(
-                f"Invalid itinerary data for itinerary_id {application.itinerary_id}"
+                f"Invalid itinerary data for itinerary_id {claim.itinerary_id}"
             )
 
-        # Create blockchain account for the user
-        web3 = Web3()
-        userblockchain_account = web3.eth.account.create()
         userblockchain_account_address = userblockchain_account.address
 
         # Validate blockchain address
-        if not userblockchain_account_address or not web3.is_address(
+        if not userblockchain_account_address or not Web3.is_address(
             userblockchain_account_address
         ):
             raise ValueError("Failed to generate valid blockchain address")
 
-        # Initialize blockchain client and issue tourist ID
-        from app.core.config import settings
-
-        if (
-            not settings.owner_address
-            or not settings.private_key
-            or not settings.contract_address
-        ):
-            raise ValueError(
-                "Blockchain configuration missing. Please set OWNER_ADDRESS, PRIVATE_KEY, and CONTRACT_ADDRESS environment variables."
-            )
-
-        blockchain_client = TouristIDClient()
-
         # Create KYC hash from user data - handle None values
-        kyc_data = {
-            "first_name": user.first_name or "",
-            "last_name": user.last_name or "",
-            "email": user.email or "",
-            "country_code": user.country_code or "",
-            "aadhar_hash": user.aadhar_number_hash or "",
-            "passport_hash": user.passport_number_hash or "",
-            "verified_by_official": admin_id,
-        }
-        kyc_json = json.dumps(kyc_data, sort_keys=True)
-        if not kyc_json or kyc_json.strip() == "":
-            raise ValueError("Invalid KYC data - cannot generate hash")
-
-        kyc_hash = blockchain_client.bytes32_from_text(kyc_json)
-        if not kyc_hash:
-            raise ValueError("Failed to generate KYC hash")
+        kyc_hash = blockchain_client.keccak32(kyc_payload(user, admin_id))
 
-        # Create itinerary hash
-        itinerary_hash = blockchain_client.bytes32_from_text(itinerary_data)
-        if not itinerary_hash:
-            raise ValueError("Failed to generate itinerary hash")
+        # Create itinerary hash (itinerary_data was validated above)
+        itinerary_hash = blockchain_client.keccak32(itinerary_data.encode())
 
         # Issue tourist ID with specified validity
         validity_seconds = issue_request.validity_days * 24 * 3600
 
-        # REAL BLOCKCHAIN TRANSACTION
-        token_id, receipt = blockchain_client.issue_id(
+        # End the read transaction so no snapshot or lock is held while the
+        # transaction is mined
+        db.commit()
+
+        # REAL BLOCKCHAIN TRANSACTION; waiting on the receipt must not block the event loop
+        token_id, receipt = await asyncio.to_thread(
+            blockchain_client.issue_id,
             tourist=userblockchain_account_address,
             kyc_hash_hex32=kyc_hash,
             itinerary_hash_hex32=itinerary_hash,
             validity_seconds=validity_seconds,
         )
+        minted = True
+
+        # One timestamp so issued_date, issued_at and the QR payload agree
+        now = datetime.datetime.utcnow()
+        transaction_hash = receipt["transactionHash"].hex()
 
         # Calculate expiry date
-        expiry_date = datetime.datetime.utcnow() + timedelta(
-            days=issue_request.validity_days
-        )
+        expiry_date = now + timedelta(days=issue_request.validity_days)
 
         # Create blockchain ID record with REAL blockchain data
         blockchain_id = BlockchainID(
             blockchain_id=str(token_id)
             if token_id != -1
-            else f"BTID{datetime.datetime.utcnow().strftime('%Y%m%d')}{application.id:08d}",
-            application_id=application.id,
-            user_id=application.user_id,
-            blockchain_hash=receipt["transactionHash"].hex(),
+            else f"BTID{now.strftime('%Y%m%d')}{application_id:08d}",
+            application_id=application_id,
+            user_id=claim.user_id,
+            blockchain_hash=transaction_hash,
             smart_contract_address=settings.contract_address,
-            transaction_hash=receipt["transactionHash"].hex(),
-            issued_date=datetime.datetime.utcnow(),
+            transaction_hash=transaction_hash,
+            issued_date=now,
             expiry_date=expiry_date,
             qr_code_data=json.dumps(
                 {
                     "blockchain_id": str(token_id),
-                    "user_id": application.user_id,
+                    "user_id": claim.user_id,
                     "blockchain_address": userblockchain_account_address,
-                    "transaction_hash": receipt["transactionHash"].hex(),
-                    "issued_date": datetime.datetime.utcnow().isoformat(),
+                    "transaction_hash": transaction_hash,
+                    "issued_date": now.isoformat(),
                     "expiry_date": expiry_date.isoformat(),
-                }
+                },
+                # Compact form keeps the QR payload (and its module count) small
+                separators=(",", ":"),
             ),
         )
 
@@ -375,119 +548,162 @@ async def issue_blockchain_id(
 
         # Create a new trip for this tourist ID
         new_trip = Trips(
-            user_id=application.user_id,
-            itinerary_id=application.itinerary_id,
+            user_id=claim.user_id,
+            itinerary_id=claim.itinerary_id,
             status=TripStatusEnum.ONGOING,  # Auto-start the trip when blockchain ID is issued
             tourist_id=str(token_id) if token_id != -1 else None,
-            blockchain_transaction_hash=receipt["transactionHash"].hex(),
+            blockchain_transaction_hash=transaction_hash,
         )
 
         # Create location sharing code for the new trip
         location_sharing = LocationSharing(
-            trip_id=new_trip.id,  # Will be set after commit
-            user_id=application.user_id,
+            trip_id=None,  # Set once the trip is flushed
+            user_id=claim.user_id,
             share_code=LocationSharing.generate_share_code(),
             is_active=True,
             expires_at=datetime.datetime.now(datetime.timezone.utc)
             + datetime.timedelta(days=issue_request.validity_days),
         )
 
-        # Update application status directly to ISSUED
-        application.status = BlockchainApplicationStatusEnum.ISSUED
-        application.issued_at = datetime.datetime.utcnow()
-        application.processed_by_admin = admin_id
-        application.admin_notes = issue_request.admin_notes
-
-        # Save all changes
-        db.add(blockchain_id)
-        db.add(user)
-        db.add(new_trip)
-        db.add(application)
-        db.commit()
-        db.refresh(blockchain_id)
-        db.refresh(new_trip)
+        # Finalize the claim ISSUING -> ISSUED in the same short transaction
+        db.execute(
+            update(BlockchainApplication)
+            .where(BlockchainApplication.id == application_id)
+            .values(
+                status=BlockchainApplicationStatusEnum.ISSUED,
+                issued_at=now,
+                admin_notes=issue_request.admin_notes,
+            )
+        )
 
-        # Update location sharing with trip_id
+        # Save all changes; flush assigns the trip id so everything commits once
+        db.add_all([blockchain_id, user, new_trip])
+        db.flush()
         location_sharing.trip_id = new_trip.id
         db.add(location_sharing)
-        db.commit()
-        db.refresh(location_sharing)
 
-        return {
+        # Build the response before commit expires the instances
+        result = {
             "success": True,
             "message": "REAL Blockchain Tourist ID issued successfully with blockchain transaction!",
             "blockchain_id": str(token_id)
             if token_id != -1
             else blockchain_id.blockchain_id,
-            "application_id": application.id,
+            "application_id": application_id,
             "tourist_id_token": token_id,
             "trip_id": new_trip.id,
             "blockchain_address": userblockchain_account_address,
-            "transaction_hash": receipt["transactionHash"].hex(),
+            "transaction_hash": transaction_hash,
             "contract_address": settings.contract_address,
-            "issued_date": blockchain_id.issued_date,
-            "expiry_date": blockchain_id.expiry_date,
+            "issued_date": now,
+            "expiry_date": expiry_date,
             "qr_code_data": blockchain_id.qr_code_data,
             "share_code": location_sharing.share_code,
         }
 
+        db.commit()
+        _invalidate_statistics_cache()
+
+        return result
+
     except Exception as e:
         db.rollback()
+        if minted:
+            # The ID exists on chain, so keep the claim for reconciliation
+            # rather than letting the application be issued twice
+            print(
+                f"Application {application_id} minted on chain but not recorded; left in ISSUING: {e}"
+            )
+        elif claimed:
+            _release_issuing_claim(application_id, db)
         raise e
 
 
+def _release_issuing_claim(application_id: int, db: Session) -> None:
+    """Return an application claimed for issuance to PENDING"""
+    try:
+        db.execute(
+            update(BlockchainApplication)
+            .where(
+                BlockchainApplication.id == application_id,
+                BlockchainApplication.status == BlockchainApplicationStatusEnum.ISSUING,
+            )
+            .values(status=BlockchainApplicationStatusEnum.PENDING)
+        )
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        print(f"Failed to release issuance claim on application {application_id}: {e}")
+
+
 def _generate_blockchain_hash(application: BlockchainApplication) -> str:
     """Generate blockchain hash for the application"""
-    import hashlib
-
     data = (
         f"{application.application_number}{application.user_id}{application.applied_at}"
     )
-    return hashlib.sha256(data.encode()).hexdigest()
+    # Local fingerprint only (never verified on chain), so BLAKE2b over SHA-256
+    return hashlib.blake2b(data.encode(), digest_size=32).hexdigest()
 
 
 # Get statistics for dashboard
 async def get_blockchain_statistics(db: Session) -> BlockchainStatistics:
     """Get statistics for admin dashboard"""
+    global _statistics_cache
+
     try:
         today = datetime.datetime.utcnow().date()
-
-        total_applications = db.exec(select(func.count(BlockchainApplication.id))).one()
-        pending_applications = db.exec(
-            select(func.count(BlockchainApplication.id)).where(
-                BlockchainApplication.status == BlockchainApplicationStatusEnum.PENDING
-            )
-        ).one()
-        issued_ids = db.exec(
-            select(func.count(BlockchainApplication.id)).where(
-                BlockchainApplication.status == BlockchainApplicationStatusEnum.ISSUED
-            )
-        ).one()
-        rejected_applications = db.exec(
-            select(func.count(BlockchainApplication.id)).where(
-                BlockchainApplication.status == BlockchainApplicationStatusEnum.REJECTED
-            )
-        ).one()
-        applications_today = db.exec(
-            select(func.count(BlockchainApplication.id)).where(
-                func.date(BlockchainApplication.applied_at) == today
-            )
-        ).one()
-        issued_today = db.exec(
-            select(func.count(BlockchainApplication.id)).where(
-                BlockchainApplication.status == BlockchainApplicationStatusEnum.ISSUED,
-                func.date(BlockchainApplication.issued_at) == today,
+        # Half-open [today, tomorrow) ranges keep applied_at/issued_at sargable
+        today_start = datetime.datetime.combine(today, datetime.time.min)
+        tomorrow_start = today_start + timedelta(days=1)
+
+        now = time.monotonic()
+        if _statistics_cache:
+            expires_at, day, cached = _statistics_cache
+            if expires_at > now and day == today:
+                return cached
+
+        # All six counters in one scan via COUNT(*) FILTER (WHERE ...)
+        row = db.exec(
+            select(
+                func.count(BlockchainApplication.id).label("total_applications"),
+                func.count(BlockchainApplication.id)
+                .filter(
+                    BlockchainApplication.status
+                    == BlockchainApplicationStatusEnum.PENDING
+                )
+                .label("pending_applications"),
+                func.count(BlockchainApplication.id)
+                .filter(
+                    BlockchainApplication.status
+                    == BlockchainApplicationStatusEnum.ISSUED
+                )
+                .label("issued_ids"),
+                func.count(BlockchainApplication.id)
+                .filter(
+                    BlockchainApplication.status
+                    == BlockchainApplicationStatusEnum.REJECTED
+                )
+                .label("rejected_applications"),
+                func.count(BlockchainApplication.id)
+                .filter(
+                    BlockchainApplication.applied_at >= today_start,
+                    BlockchainApplication.applied_at < tomorrow_start,
+                )
+                .label("applications_today"),
+                func.count(BlockchainApplication.id)
+                .filter(
+                    BlockchainApplication.status
+                    == BlockchainApplicationStatusEnum.ISSUED,
+                    BlockchainApplication.issued_at >= today_start,
+                    BlockchainApplication.issued_at < tomorrow_start,
+                )
+                .label("issued_today"),
             )
         ).one()
 
-        return BlockchainStatistics(
-            total_applications=total_applications,
-            pending_applications=pending_applications,
-            issued_ids=issued_ids,
-            rejected_applications=rejected_applications,
-            applications_today=applications_today,
-            issued_today=issued_today,
-        )
+        statistics = BlockchainStatistics(**row._asdict())
+        _statistics_cache = (now + STATISTICS_CACHE_TTL_SECONDS, today, statistics)
+        return statistics
 
     except Exception as e:
         raise e
@@ -1,7 +1,7 @@
 from sqlmodel import Session, select
 from typing import List, Optional
 from fastapi import HTTPException, status
-from sqlalchemy import text
+from sqlalchemy import func, insert, text
 from datetime import datetime
 
 from shapely.geometry import Polygon, Point
@@ -18,6 +18,14 @@ from app.models.schemas.geofencing import (
     PolygonCoordinate,
 )
 
+# Built once so every boundary write shares one cached statement; the polygon
+# is always a bound parameter, never part of the SQL text
+_SET_BOUNDARY_SQL = text(
+    "UPDATE restricted_areas "
+    "SET boundary = ST_GeomFromText(:wkt_polygon, 4326) "
+    "WHERE id = :area_id"
+)
+
 
 def validate_polygon_geometry(coordinates: List[PolygonCoordinate]) -> dict:
     """Validate polygon geometry and return validation results with Shapely"""
@@ -138,41 +146,38 @@ async def create_restricted_area(
         # Convert coordinates to WKT polygon using Shapely (includes validation)
         wkt_polygon = coordinates_to_wkt_polygon(area_data.boundary_coordinates)
 
-        # Create the restricted area
-        restricted_area = RestrictedAreas(
-            name=area_data.name,
-            description=area_data.description,
-            area_type=area_data.area_type,
-            created_by_admin_id=admin_user_id,
-            severity_level=area_data.severity_level,
-            restriction_reason=area_data.restriction_reason,
-            contact_info=area_data.contact_info,
-            valid_from=area_data.valid_from,
-            valid_until=area_data.valid_until,
-            send_warning_notification=area_data.send_warning_notification,
-            auto_alert_authorities=area_data.auto_alert_authorities,
-            buffer_distance_meters=area_data.buffer_distance_meters,
-        )
-
-        # Add to database and get ID
-        db.add(restricted_area)
-        db.flush()  # Get the ID
-
-        # Update with geometry using WKT string and ST_GeomFromText
-        db.execute(
-            text("""
-                UPDATE restricted_areas 
-                SET boundary = ST_GeomFromText(:wkt_polygon, 4326)
-                WHERE id = :area_id
-            """),
-            {"wkt_polygon": wkt_polygon, "area_id": restricted_area.id},
+        # Single INSERT ... RETURNING writes the geometry with the row and reads
+        # back everything the response needs (no follow-up UPDATE or SELECTs)
+        statement = (
+            insert(RestrictedAreas)
+            .values(
+                name=area_data.name,
+                description=area_data.description,
+                area_type=area_data.area_type,
+                boundary=func.ST_GeomFromText(wkt_polygon, 4326),
+                created_by_admin_id=admin_user_id,
+                severity_level=area_data.severity_level,
+                restriction_reason=area_data.restriction_reason,
+                contact_info=area_data.contact_info,
+                valid_from=area_data.valid_from,
+                valid_until=area_data.valid_until,
+                send_warning_notification=area_data.send_warning_notification,
+                auto_alert_authorities=area_data.auto_alert_authorities,
+                buffer_distance_meters=area_data.buffer_distance_meters,
+            )
+            .returning(
+                *(
+                    column
+                    for column in RestrictedAreas.__table__.c
+                    if column.name != "boundary"
+                ),
+                func.ST_AsText(RestrictedAreas.boundary).label("wkt_geometry"),
+            )
         )
-
+        row = db.execute(statement).one()
         db.commit()
-        db.refresh(restricted_area)
 
-        # Convert to response format
-        return await get_restricted_area_by_id(restricted_area.id, db)
+        return _restricted_area_response(row, row.wkt_geometry)
 
     except Exception as e:
         db.rollback()
@@ -232,12 +237,40 @@ async def get_active_restricted_areas_for_routing(db: Session) -> List[str]:
         return []
 
 
+def _restricted_area_response(
+    area, wkt_geometry: Optional[str]
+) -> RestrictedAreaResponse:
+    """Build the response from a restricted area row/object and its WKT boundary"""
+    coordinates = []
+    if wkt_geometry:
+        coordinates = wkt_polygon_to_coordinates(wkt_geometry)
+
+    return RestrictedAreaResponse(
+        id=area.id,
+        name=area.name,
+        description=area.description,
+        area_type=area.area_type,
+        status=area.status,
+        boundary_coordinates=coordinates,
+        created_by_admin_id=area.created_by_admin_id,
+        severity_level=area.severity_level,
+        restriction_reason=area.restriction_reason,
+        contact_info=area.contact_info,
+        valid_from=area.valid_from,
+        valid_until=area.valid_until,
+        send_warning_notification=area.send_warning_notification,
+        auto_alert_authorities=area.auto_alert_authorities,
+        buffer_distance_meters=area.buffer_distance_meters,
+        created_at=area.created_at,
+        updated_at=area.updated_at,
+    )
+
+
 async def get_restricted_area_by_id(
     area_id: int, db: Session
 ) -> RestrictedAreaResponse:
     """Get a restricted area by ID"""
-    statement = select(RestrictedAreas).where(RestrictedAreas.id == area_id)
-    restricted_area = db.exec(statement).first()
+    restricted_area = db.get(RestrictedAreas, area_id)
 
     if not restricted_area:
         raise HTTPException(
@@ -254,28 +287,8 @@ async def get_restricted_area_by_id(
         {"area_id": area_id},
     ).first()
 
-    coordinates = []
-    if result and result.wkt_geometry:
-        coordinates = wkt_polygon_to_coordinates(result.wkt_geometry)
-
-    return RestrictedAreaResponse(
-        id=restricted_area.id,
-        name=restricted_area.name,
-        description=restricted_area.description,
-        area_type=restricted_area.area_type,
-        status=restricted_area.status,
-        boundary_coordinates=coordinates,
-        created_by_admin_id=restricted_area.created_by_admin_id,
-        severity_level=restricted_area.severity_level,
-        restriction_reason=restricted_area.restriction_reason,
-        contact_info=restricted_area.contact_info,
-        valid_from=restricted_area.valid_from,
-        valid_until=restricted_area.valid_until,
-        send_warning_notification=restricted_area.send_warning_notification,
-        auto_alert_authorities=restricted_area.auto_alert_authorities,
-        buffer_distance_meters=restricted_area.buffer_distance_meters,
-        created_at=restricted_area.created_at,
-        updated_at=restricted_area.updated_at,
+    return _restricted_area_response(
+        restricted_area, result.wkt_geometry if result else None
     )
 
 
@@ -320,8 +333,7 @@ async def update_restricted_area(
     area_id: int, area_data: RestrictedAreaUpdate, db: Session
 ) -> RestrictedAreaResponse:
     """Update an existing restricted area"""
-    statement = select(RestrictedAreas).where(RestrictedAreas.id == area_id)
-    restricted_area = db.exec(statement).first()
+    restricted_area = db.get(RestrictedAreas, area_id)
 
     if not restricted_area:
         raise HTTPException(
@@ -340,12 +352,7 @@ async def update_restricted_area(
         if area_data.boundary_coordinates:
             wkt_polygon = coordinates_to_wkt_polygon(area_data.boundary_coordinates)
             db.execute(
-                text(f"""
-                    UPDATE restricted_areas 
-                    SET boundary = ST_GeomFromText('{wkt_polygon}', 4326)
-                    WHERE id = :area_id
-                """),
-                {"area_id": area_id},
+                _SET_BOUNDARY_SQL, {"wkt_polygon": wkt_polygon, "area_id": area_id}
             )
 
         db.commit()
@@ -363,8 +370,7 @@ async def update_restricted_area(
 
 async def delete_restricted_area(area_id: int, db: Session) -> bool:
     """Delete a restricted area"""
-    statement = select(RestrictedAreas).where(RestrictedAreas.id == area_id)
-    restricted_area = db.exec(statement).first()
+    restricted_area = db.get(RestrictedAreas, area_id)
 
     if not restricted_area:
         raise HTTPException(
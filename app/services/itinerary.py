@@ -11,6 +11,7 @@ from app.models.schemas.itinerary import (
 )
 from typing import List, Optional
 import datetime
+import json
 
 
 async def create_itinerary(
@@ -318,11 +319,8 @@ async def get_itinerary_for_blockchain(itinerary_id: int, db: Session) -> str:
     Returns a JSON string representation of the itinerary and its days.
     """
     try:
-        import json
-
         # Get the itinerary
-        statement = select(Itinerary).where(Itinerary.id == itinerary_id)
-        itinerary = db.exec(statement).first()
+        itinerary = db.get(Itinerary, itinerary_id)
         if not itinerary:
             raise ValueError(f"Itinerary with id {itinerary_id} not found")
 
@@ -1,4 +1,5 @@
 # Removed duplicate imports
+from sqlalchemy import or_
 from sqlmodel import select, Session
 from shapely.geometry import LineString
 from geoalchemy2.shape import from_shape, to_shape
@@ -15,12 +16,22 @@ from app.models.database.offline_activity import (
     OfflineActivityRouteData,
 )
 from typing import List, Dict, Any, Optional, Tuple
+from app.utils.geo import (
+    bbox_filter,
+    filter_within_radius,
+    lat_lng_columns,
+    make_point,
+)
+from app.utils.pagination import cached_count, count_cache_key
+
+# Rows fetched per server-side cursor batch when radius filtering in Python
+RADIUS_SCAN_BATCH_SIZE = 500
 
 
 def _serialize_geometry_to_lat_lng(activity: OfflineActivity) -> Dict[str, Any]:
     """Convert OfflineActivity with geometry to dict with latitude/longitude."""
     activity_data = activity.dict()
-    if hasattr(activity, "location") and activity.location:
+    if activity.location is not None:
         try:
             point = to_shape(activity.location)
             activity_data["latitude"] = point.y
@@ -33,6 +44,17 @@ def _serialize_geometry_to_lat_lng(activity: OfflineActivity) -> Dict[str, Any]:
     return activity_data
 
 
+def _serialize_with_coordinates(
+    activity: OfflineActivity, latitude: Optional[float], longitude: Optional[float]
+) -> Dict[str, Any]:
+    """Convert OfflineActivity to dict using latitude/longitude selected in SQL."""
+    activity_data = activity.dict()
+    activity_data["latitude"] = latitude
+    activity_data["longitude"] = longitude
+    activity_data.pop("location", None)
+    return activity_data
+
+
 async def create_offline_activity(
     created_by_id: int, offline_activity_create_data: OfflineActivityCreate, db: Session
 ) -> Dict[str, Any]:
@@ -40,15 +62,13 @@ async def create_offline_activity(
         data = offline_activity_create_data.model_dump()
         latitude = data.pop("latitude")
         longitude = data.pop("longitude")
-        # WKT format: POINT(longitude latitude)
-        wkt_point = f"POINT({longitude} {latitude})"
-        data["location"] = wkt_point
+        data["location"] = make_point(latitude, longitude)
         new_activity = OfflineActivity(**data)
         new_activity.created_by = created_by_id
         db.add(new_activity)
         db.commit()
         db.refresh(new_activity)
-        return _serialize_geometry_to_lat_lng(new_activity)
+        return _serialize_with_coordinates(new_activity, latitude, longitude)
     except Exception as e:
         db.rollback()
         raise e
@@ -57,8 +77,7 @@ async def create_offline_activity(
 async def get_offline_activity_by_id(
     activity_id: int, db: Session
 ) -> Dict[str, Any] | None:
-    statement = select(OfflineActivity).where(OfflineActivity.id == activity_id)
-    activity = db.exec(statement).first()
+    activity = db.get(OfflineActivity, activity_id)
     if not activity:
         return None
     return _serialize_geometry_to_lat_lng(activity)
@@ -68,36 +87,37 @@ async def _get_offline_activity_raw_by_id(
     activity_id: int, db: Session
 ) -> OfflineActivity | None:
     """Get raw OfflineActivity object without serialization - for internal use only."""
-    statement = select(OfflineActivity).where(OfflineActivity.id == activity_id)
-    activity = db.exec(statement).first()
+    activity = db.get(OfflineActivity, activity_id)
     return activity
 
 
 async def get_all_offline_activities(db: Session) -> List[Dict[str, Any]]:
     """Get all offline activities from the database."""
-    statement = select(OfflineActivity)
+    statement = select(OfflineActivity, *lat_lng_columns(OfflineActivity.location))
     activities = db.exec(statement).all()
-    return [_serialize_geometry_to_lat_lng(activity) for activity in activities]
+    return [_serialize_with_coordinates(*row) for row in activities]
 
 
 async def get_offline_activities_by_difficulty(
     difficulty: str, db: Session
 ) -> List[Dict[str, Any]]:
     """Get offline activities filtered by difficulty level."""
-    statement = select(OfflineActivity).where(
-        OfflineActivity.difficulty_level == difficulty
-    )
+    statement = select(
+        OfflineActivity, *lat_lng_columns(OfflineActivity.location)
+    ).where(OfflineActivity.difficulty_level == difficulty)
     activities = db.exec(statement).all()
-    return [_serialize_geometry_to_lat_lng(activity) for activity in activities]
+    return [_serialize_with_coordinates(*row) for row in activities]
 
 
 async def get_offline_activities_by_state(
     state: str, db: Session
 ) -> List[Dict[str, Any]]:
     """Get offline activities filtered by state."""
-    statement = select(OfflineActivity).where(OfflineActivity.state.ilike(f"%{state}%"))
+    statement = select(
+        OfflineActivity, *lat_lng_columns(OfflineActivity.location)
+    ).where(OfflineActivity.state.ilike(f"%{state}%"))
     activities = db.exec(statement).all()
-    return [_serialize_geometry_to_lat_lng(activity) for activity in activities]
+    return [_serialize_with_coordinates(*row) for row in activities]
 
 
 async def get_offline_activities_with_filters(
@@ -109,7 +129,7 @@ async def get_offline_activities_with_filters(
     limit: Optional[int] = None,
 ) -> List[Dict[str, Any]]:
     """Get offline activities with optional filters."""
-    statement = select(OfflineActivity)
+    statement = select(OfflineActivity, *lat_lng_columns(OfflineActivity.location))
 
     # Apply filters if provided
     if state:
@@ -129,7 +149,7 @@ async def get_offline_activities_with_filters(
         statement = statement.limit(limit)
 
     activities = db.exec(statement).all()
-    return [_serialize_geometry_to_lat_lng(activity) for activity in activities]
+    return [_serialize_with_coordinates(*row) for row in activities]
 
 
 async def search_offline_activities_by_name(
@@ -138,22 +158,23 @@ async def search_offline_activities_by_name(
     limit: Optional[int] = None,
 ) -> List[Dict[str, Any]]:
     """Search offline activities by name."""
-    statement = select(OfflineActivity).where(OfflineActivity.name.ilike(f"%{name}%"))
+    statement = select(
+        OfflineActivity, *lat_lng_columns(OfflineActivity.location)
+    ).where(OfflineActivity.name.ilike(f"%{name}%"))
 
     # Apply limit if provided
     if limit:
         statement = statement.limit(limit)
 
     activities = db.exec(statement).all()
-    return [_serialize_geometry_to_lat_lng(activity) for activity in activities]
+    return [_serialize_with_coordinates(*row) for row in activities]
 
 
 async def update_offline_activity(
     activity_id: int, activity_update_data: OfflineActivityUpdate, db: Session
 ) -> Dict[str, Any] | None:
     try:
-        statement = select(OfflineActivity).where(OfflineActivity.id == activity_id)
-        activity = db.exec(statement).first()
+        activity = db.get(OfflineActivity, activity_id)
         if not activity:
             return None
         update_data = activity_update_data.model_dump(exclude_unset=True)
@@ -232,8 +253,7 @@ async def delete_offline_activity(activity_id: int, db: Session) -> bool:
     Returns True if successful, False if activity not found
     """
     try:
-        statement = select(OfflineActivity).where(OfflineActivity.id == activity_id)
-        activity = db.exec(statement).first()
+        activity = db.get(OfflineActivity, activity_id)
         if not activity:
             return False
         route_statement = select(OfflineActivityRouteData).where(
@@ -250,27 +270,6 @@ async def delete_offline_activity(activity_id: int, db: Session) -> bool:
         raise e
 
 
-def calculate_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
-    """Calculate the distance between two points in kilometers using Haversine formula."""
-    import math
-
-    # Convert latitude and longitude from degrees to radians
-    lat1, lon1, lat2, lon2 = map(math.radians, [lat1, lon1, lat2, lon2])
-
-    # Haversine formula
-    dlat = lat2 - lat1
-    dlon = lon2 - lon1
-    a = (
-        math.sin(dlat / 2) ** 2
-        + math.cos(lat1) * math.cos(lat2) * math.sin(dlon / 2) ** 2
-    )
-    c = 2 * math.asin(math.sqrt(a))
-
-    # Radius of Earth in kilometers
-    r = 6371
-    return c * r
-
-
 async def search_offline_activities(
     search_query: OfflineActivitySearchQuery,
     page: int = 1,
@@ -279,9 +278,7 @@ async def search_offline_activities(
 ) -> Tuple[List[Dict[str, Any]], int]:
     """Search offline activities with filtering and pagination."""
     try:
-        from sqlalchemy import or_
-
-        statement = select(OfflineActivity)
+        statement = select(OfflineActivity, *lat_lng_columns(OfflineActivity.location))
 
         # Universal search across name, city, and state
         if search_query.query:
@@ -319,45 +316,60 @@ async def search_offline_activities(
                 OfflineActivity.difficulty_level == search_query.difficulty_level
             )
 
-        # Execute query to get filtered results
-        activities = db.exec(statement).all()
+        if (
+            search_query.latitude is not None
+            and search_query.longitude is not None
+            and search_query.radius_km is not None
+        ):
+            statement = statement.where(
+                OfflineActivity.location.isnot(None),
+                bbox_filter(
+                    OfflineActivity.location,
+                    search_query.latitude,
+                    search_query.longitude,
+                    search_query.radius_km,
+                ),
+            )
+
+        start_index = (page - 1) * page_size
 
         # Apply location-based filtering if coordinates provided
-        filtered_activities = []
         if (
             search_query.latitude is not None
             and search_query.longitude is not None
             and search_query.radius_km is not None
         ):
-            for activity in activities:
-                try:
-                    if activity.location:
-                        point = to_shape(activity.location)
-                        distance = calculate_distance(
-                            search_query.latitude,
-                            search_query.longitude,
-                            point.y,
-                            point.x,
-                        )
-                        if distance <= search_query.radius_km:
-                            filtered_activities.append(activity)
-                except Exception:
-                    continue
+            # Stream candidates in batches; only the requested page is kept
+            total_count = 0
+            paginated_activities = []
+            candidates = db.exec(
+                statement.execution_options(yield_per=RADIUS_SCAN_BATCH_SIZE)
+            )
+            for batch in candidates.partitions():
+                for row in filter_within_radius(
+                    batch,
+                    search_query.latitude,
+                    search_query.longitude,
+                    search_query.radius_km,
+                ):
+                    if start_index <= total_count < start_index + page_size:
+                        paginated_activities.append(row)
+                    total_count += 1
         else:
-            filtered_activities = activities
-
-        # Get total count
-        total_count = len(filtered_activities)
-
-        # Apply pagination
-        start_index = (page - 1) * page_size
-        end_index = start_index + page_size
-        paginated_activities = filtered_activities[start_index:end_index]
+            total_count = cached_count(
+                db,
+                statement,
+                count_cache_key(
+                    "offline_activities.search", **search_query.model_dump()
+                ),
+            )
+            paginated_activities = db.exec(
+                statement.offset(start_index).limit(page_size)
+            ).all()
 
         # Serialize activities
         serialized_activities = [
-            _serialize_geometry_to_lat_lng(activity)
-            for activity in paginated_activities
+            _serialize_with_coordinates(*row) for row in paginated_activities
         ]
 
         return serialized_activities, total_count
@@ -1,9 +1,16 @@
+from sqlalchemy import or_
 from sqlmodel import Session, select
 from app.models.database.online_activity import OnlineActivity
 from typing import Optional, List, Tuple, Dict, Any
 import datetime
-import math
 from geoalchemy2.shape import to_shape
+from app.utils.geo import (
+    bbox_filter,
+    lat_lng_columns,
+    make_point,
+    nearest_within_radius,
+)
+from app.utils.pagination import cached_count, count_cache_key
 from app.models.schemas.online_activity import (
     OnlineActivityCreate,
     OnlineActivityUpdate,
@@ -15,7 +22,7 @@ def _serialize_geometry_to_lat_lng(activity: OnlineActivity) -> Dict[str, Any]:
     """Convert OnlineActivity with geometry to dict with latitude/longitude."""
     activity_data = activity.dict()
 
-    if hasattr(activity, "location") and activity.location:
+    if activity.location is not None:
         try:
             point = to_shape(activity.location)
             activity_data["latitude"] = point.y
@@ -29,6 +36,16 @@ def _serialize_geometry_to_lat_lng(activity: OnlineActivity) -> Dict[str, Any]:
     return activity_data
 
 
+def _serialize_with_coordinates(
+    activity: OnlineActivity, latitude: Optional[float], longitude: Optional[float]
+) -> Dict[str, Any]:
+    """Convert OnlineActivity to dict using latitude/longitude selected in SQL."""
+    activity_data = activity.dict()
+    activity_data["latitude"] = latitude
+    activity_data["longitude"] = longitude
+    return activity_data
+
+
 async def create_online_activity(
     online_activity_data: OnlineActivityCreate, admin_id: int, db: Session
 ) -> Dict[str, Any]:
@@ -37,9 +54,7 @@ async def create_online_activity(
         data = online_activity_data.model_dump()
         latitude = data.pop("latitude")
         longitude = data.pop("longitude")
-        # WKT format: POINT(longitude latitude)
-        wkt_point = f"POINT({longitude} {latitude})"
-        data["location"] = wkt_point
+        data["location"] = make_point(latitude, longitude)
 
         place = OnlineActivity(
             **data,
@@ -51,7 +66,7 @@ async def create_online_activity(
         db.commit()
         db.refresh(place)
 
-        return _serialize_geometry_to_lat_lng(place)
+        return _serialize_with_coordinates(place, latitude, longitude)
     except Exception as e:
         db.rollback()
         raise e
@@ -96,8 +111,7 @@ async def update_online_activity(
             latitude = update_dict.pop("latitude")
             longitude = update_dict.pop("longitude")
             if latitude is not None and longitude is not None:
-                wkt_point = f"POINT({longitude} {latitude})"
-                update_dict["location"] = wkt_point
+                update_dict["location"] = make_point(latitude, longitude)
         elif "latitude" in update_dict or "longitude" in update_dict:
             # Remove individual lat/lng fields if only one is provided
             update_dict.pop("latitude", None)
@@ -137,29 +151,6 @@ async def delete_online_activity(online_activity_id: int, db: Session) -> bool:
         raise e
 
 
-def calculate_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
-    """
-    Calculate the distance between two points on Earth using Haversine formula.
-    Returns distance in kilometers.
-    """
-    # Convert latitude and longitude from degrees to radians
-    lat1, lon1, lat2, lon2 = map(math.radians, [lat1, lon1, lat2, lon2])
-
-    # Haversine formula
-    dlat = lat2 - lat1
-    dlon = lon2 - lon1
-    a = (
-        math.sin(dlat / 2) ** 2
-        + math.cos(lat1) * math.cos(lat2) * math.sin(dlon / 2) ** 2
-    )
-    c = 2 * math.asin(math.sqrt(a))
-
-    # Radius of Earth in kilometers
-    r = 6371
-
-    return c * r
-
-
 async def search_online_activities(
     search_query: OnlineActivitySearchQuery,
     page: int = 1,
@@ -168,9 +159,9 @@ async def search_online_activities(
 ) -> Tuple[List[Dict[str, Any]], int]:
     """Search online activities with filtering and pagination."""
     try:
-        from sqlalchemy import or_
-
-        statement = select(OnlineActivity).where(OnlineActivity.is_active)
+        statement = select(
+            OnlineActivity, *lat_lng_columns(OnlineActivity.location)
+        ).where(OnlineActivity.is_active)
 
         # Universal search across name, city, and state
         if search_query.query:
@@ -203,8 +194,11 @@ async def search_online_activities(
             )
 
         # Get total count
-        count_statement = statement
-        total_count = len(db.exec(count_statement).all())
+        total_count = cached_count(
+            db,
+            statement,
+            count_cache_key("online_activities.search", **search_query.model_dump()),
+        )
 
         # Apply pagination
         offset = (page - 1) * page_size
@@ -212,7 +206,7 @@ async def search_online_activities(
 
         activities = db.exec(statement).all()
         serialized_activities = [
-            _serialize_geometry_to_lat_lng(activity) for activity in activities
+            _serialize_with_coordinates(*row) for row in activities
         ]
         return serialized_activities, total_count
 
@@ -225,38 +219,22 @@ async def get_nearby_online_activities(
 ) -> List[Dict[str, Any]]:
     """Get online activities within a radius of given coordinates."""
     try:
-        # Get all active activities
-        statement = select(OnlineActivity).where(OnlineActivity.is_active)
-        all_activities = db.exec(statement).all()
-
-        # Filter by distance
-        nearby_activities = []
-        for activity in all_activities:
-            if hasattr(activity, "location") and activity.location:
-                try:
-                    point = to_shape(activity.location)
-                    activity_lat = point.y
-                    activity_lng = point.x
-                    distance = calculate_distance(
-                        latitude,
-                        longitude,
-                        float(activity_lat),
-                        float(activity_lng),
-                    )
-                    if distance <= radius_km:
-                        nearby_activities.append((activity, distance))
-                except Exception:
-                    continue
-
-        # Sort by distance and limit
-        nearby_activities.sort(key=lambda a: a[1])
-
-        # Return serialized activities without distance
-        result = []
-        for activity, _ in nearby_activities[:limit]:
-            result.append(_serialize_geometry_to_lat_lng(activity))
-
-        return result
+        # Get active activities with coordinates, pruned to the radius bounding box
+        statement = select(
+            OnlineActivity, *lat_lng_columns(OnlineActivity.location)
+        ).where(
+            OnlineActivity.is_active,
+            OnlineActivity.location.isnot(None),
+            bbox_filter(OnlineActivity.location, latitude, longitude, radius_km),
+        )
+        candidates = db.exec(statement).all()
+
+        # Filter by distance over coordinate arrays, nearest first
+        nearby_activities = nearest_within_radius(
+            candidates, latitude, longitude, radius_km, limit
+        )
+
+        return [_serialize_with_coordinates(*row) for row in nearby_activities]
 
     except Exception as e:
         raise e
@@ -268,7 +246,7 @@ async def get_online_activities_by_type(
     """Get online activities by type."""
     try:
         statement = (
-            select(OnlineActivity)
+            select(OnlineActivity, *lat_lng_columns(OnlineActivity.location))
             .where(
                 OnlineActivity.is_active,
                 OnlineActivity.place_type.ilike(f"%{activity_type}%"),
@@ -277,7 +255,7 @@ async def get_online_activities_by_type(
         )
 
         activities = db.exec(statement).all()
-        return [_serialize_geometry_to_lat_lng(activity) for activity in activities]
+        return [_serialize_with_coordinates(*row) for row in activities]
 
     except Exception as e:
         raise e
@@ -289,13 +267,13 @@ async def get_online_activities_by_city(
     """Get online activities by city."""
     try:
         statement = (
-            select(OnlineActivity)
+            select(OnlineActivity, *lat_lng_columns(OnlineActivity.location))
             .where(OnlineActivity.is_active, OnlineActivity.city.ilike(f"%{city}%"))
             .limit(limit)
         )
 
         activities = db.exec(statement).all()
-        return [_serialize_geometry_to_lat_lng(activity) for activity in activities]
+        return [_serialize_with_coordinates(*row) for row in activities]
 
     except Exception as e:
         raise e
@@ -2,10 +2,14 @@
 GraphHopper routing service for calculating routes between points.
 """
 
+import re
 import aiohttp
 from typing import List, Dict, Any, Optional, Tuple
 from app.core.config import settings
 
+# Matches the outer ring of a WKT POLYGON, e.g. "POLYGON((lon1 lat1,lon2 lat2,...))"
+WKT_POLYGON_RING = re.compile(r"POLYGON\(\((.*?)\)\)")
+
 
 class GraphHopperService:
     """Service to interact with self-hosted GraphHopper instance."""
@@ -92,7 +96,6 @@ class GraphHopperService:
                 async with session.post(
                     url, json=payload, headers={"Content-Type": "application/json"}
                 ) as response:
-                    response_text = await response.text()
                     print(f"DEBUG: GraphHopper response status: {response.status}")
 
                     if response.status == 200:
@@ -102,6 +105,7 @@ class GraphHopperService:
                         )
                         return result
                     else:
+                        response_text = await response.text()
                         print(f"GraphHopper API error: {response.status}")
                         print(f"Error details: {response_text}")
                         return None
@@ -182,7 +186,6 @@ class GraphHopperService:
         """
         try:
             from app.services.geofencing import get_active_restricted_areas_for_routing
-            import re
 
             # Get WKT polygons
             wkt_polygons = await get_active_restricted_areas_for_routing(db)
@@ -198,7 +201,7 @@ class GraphHopperService:
                     # Example: "POLYGON((lon1 lat1,lon2 lat2,lon3 lat3,lon1 lat1))"
 
                     # Use regex to extract coordinate pairs
-                    match = re.search(r"POLYGON\(\((.*?)\)\)", wkt_polygon)
+                    match = WKT_POLYGON_RING.search(wkt_polygon)
                     if not match:
                         print(
                             f"Warning: Invalid WKT format for polygon {i}: {wkt_polygon[:50]}..."
@@ -291,9 +294,8 @@ class GraphHopperService:
             "time_minutes": round(path.get("time", 0) / 60, 1),
             "time_hours": round(path.get("time", 0) / 3600, 2),
             "geometry": geojson_geometry,
-            "coordinates": coordinates,  # Keep raw coordinates for backward compatibility
             "instructions": path.get("instructions", []),
-            "bbox": path.get("bbox", []),
+            "bbox": path.get("bbox") or None,
         }
 
 
@@ -1,12 +1,12 @@
 from sqlmodel import Session, select
 from app.models.database.trips import Trips, TripStatusEnum
-from app.utils.blockchain import TouristIDClient, TouristInfo
+from app.utils.blockchain import TouristInfo, get_tourist_id_client
 from typing import Optional
 
 
 class TouristIDService:
     def __init__(self):
-        self.blockchain_client = TouristIDClient()
+        self.blockchain_client = get_tourist_id_client()
 
     def get_user_active_trip(self, user_id: int, db: Session) -> Optional[Trips]:
         """Get the user's active trip with tourist ID."""
@@ -2,6 +2,7 @@ from sqlmodel import Session, select, desc
 from app.models.database.trips import Trips, TripStatusEnum
 from app.models.database.location_history import LocationHistory
 from app.models.database.location_sharing import LocationSharing
+from app.models.schemas.trips import TripWithShareCodeResponse
 from typing import Sequence, Optional
 from geoalchemy2.shape import from_shape
 from shapely.geometry import Point
@@ -9,8 +10,7 @@ import datetime
 
 
 async def get_trip_by_id(trip_id: int, db: Session) -> Trips | None:
-    statement = select(Trips).where(Trips.id == trip_id)
-    trip = db.exec(statement).first()
+    trip = db.get(Trips, trip_id)
     return trip
 
 
@@ -20,7 +20,9 @@ async def get_user_trips(user_id: int, db: Session) -> Sequence[Trips] | None:
     return trips
 
 
-async def get_user_trips_with_share_codes(user_id: int, db: Session) -> list[dict]:
+async def get_user_trips_with_share_codes(
+    user_id: int, db: Session
+) -> list[TripWithShareCodeResponse]:
     """Get user trips with their location sharing information"""
 
     # First get all user trips
@@ -38,21 +40,20 @@ async def get_user_trips_with_share_codes(user_id: int, db: Session) -> list[dic
             .where(LocationSharing.user_id == user_id)
         ).first()
 
-        trip_data = {
-            "id": trip.id,
-            "user_id": trip.user_id,
-            "itinerary_id": trip.itinerary_id,
-            "status": trip.status.value,
-            "tourist_id": trip.tourist_id,
-            "blockchain_transaction_hash": trip.blockchain_transaction_hash,
-            "created_at": trip.created_at,
-            "updated_at": trip.updated_at,
-            "share_code": location_sharing.share_code if location_sharing else None,
-            "share_expires_at": location_sharing.expires_at
-            if location_sharing
-            else None,
-            "share_is_active": location_sharing.is_active if location_sharing else None,
-        }
+        # Rows come straight from the DB, so skip re-validating every field
+        trip_data = TripWithShareCodeResponse.model_construct(
+            id=trip.id,
+            user_id=trip.user_id,
+            itinerary_id=trip.itinerary_id,
+            status=trip.status.value,
+            tourist_id=trip.tourist_id,
+            blockchain_transaction_hash=trip.blockchain_transaction_hash,
+            created_at=trip.created_at,
+            updated_at=trip.updated_at,
+            share_code=location_sharing.share_code if location_sharing else None,
+            share_expires_at=location_sharing.expires_at if location_sharing else None,
+            share_is_active=location_sharing.is_active if location_sharing else None,
+        )
         trips_with_sharing.append(trip_data)
 
     return trips_with_sharing
@@ -1,9 +1,10 @@
 from typing import List, Optional
 from fastapi import HTTPException, status
-from sqlmodel import Session, select, desc
+from sqlmodel import Session, select, desc, func
 
 from app.models.database.user import User, UserRoleEnum
 from app.models.schemas.auth import UserResponse
+from app.utils.validation import type_adapter
 
 
 class UserService:
@@ -20,23 +21,15 @@ class UserService:
     ) -> List[UserResponse]:
         """Get all users with optional filtering"""
         try:
-            statement = select(User)
-
-            # Apply filters
-            if role_filter:
-                statement = statement.where(User.role == role_filter)
-
-            if is_active_filter is not None:
-                statement = statement.where(User.is_active == is_active_filter)
-
-            if is_verified_filter is not None:
-                statement = statement.where(User.is_kyc_verified == is_verified_filter)
+            statement = UserService._apply_filters(
+                select(User), role_filter, is_active_filter, is_verified_filter
+            )
 
             statement = statement.offset(offset).limit(limit).order_by(desc(User.id))
 
             users = db.exec(statement).all()
 
-            return [UserResponse.model_validate(user) for user in users]
+            return type_adapter(List[UserResponse]).validate_python(users)
 
         except Exception as e:
             raise HTTPException(
@@ -44,12 +37,53 @@ class UserService:
                 detail=f"Failed to retrieve users: {str(e)}",
             )
 
+    @staticmethod
+    async def count_users(
+        db: Session,
+        role_filter: Optional[UserRoleEnum] = None,
+        is_active_filter: Optional[bool] = None,
+        is_verified_filter: Optional[bool] = None,
+    ) -> int:
+        """Count users matching the same filters as get_all_users"""
+        try:
+            statement = UserService._apply_filters(
+                select(func.count(User.id)),
+                role_filter,
+                is_active_filter,
+                is_verified_filter,
+            )
+            return db.exec(statement).one()
+
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to count users: {str(e)}",
+            )
+
+    @staticmethod
+    def _apply_filters(
+        statement,
+        role_filter: Optional[UserRoleEnum],
+        is_active_filter: Optional[bool],
+        is_verified_filter: Optional[bool],
+    ):
+        """Apply the optional user list filters to a statement"""
+        if role_filter:
+            statement = statement.where(User.role == role_filter)
+
+        if is_active_filter is not None:
+            statement = statement.where(User.is_active == is_active_filter)
+
+        if is_verified_filter is not None:
+            statement = statement.where(User.is_kyc_verified == is_verified_filter)
+
+        return statement
+
     @staticmethod
     async def get_user_by_id(db: Session, user_id: int) -> UserResponse:
         """Get user by ID"""
         try:
-            statement = select(User).where(User.id == user_id)
-            user = db.exec(statement).first()
+            user = db.get(User, user_id)
 
             if not user:
                 raise HTTPException(
@@ -70,8 +104,7 @@ class UserService:
     async def verify_user(db: Session, user_id: int, admin_id: int) -> UserResponse:
         """Verify a user's KYC status"""
         try:
-            statement = select(User).where(User.id == user_id)
-            user = db.exec(statement).first()
+            user = db.get(User, user_id)
 
             if not user:
                 raise HTTPException(
@@ -156,8 +189,7 @@ class UserService:
     ) -> UserResponse:
         """Update user active status"""
         try:
-            statement = select(User).where(User.id == user_id)
-            user = db.exec(statement).first()
+            user = db.get(User, user_id)
 
             if not user:
                 raise HTTPException(
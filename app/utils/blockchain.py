@@ -1,11 +1,13 @@
 # app/blockchain/tourist_id_client.py
 from dataclasses import dataclass
-from typing import Any, Tuple, Dict
+from typing import Any, Tuple, Dict, Optional
 from web3 import Web3
 from web3.types import TxReceipt
 from eth_account import Account
 from hexbytes import HexBytes
 from app.core.config import settings
+import json
+import threading
 import warnings
 import logging
 
@@ -422,6 +424,10 @@ class TouristIDClient:
         if self.account.address.lower() != self.owner.lower():
             raise ValueError("private_key does not match owner_address")
 
+        # Issuances run in worker threads on this shared client; nonce lookup
+        # through broadcast must not interleave or two sends reuse a nonce
+        self._send_lock = threading.Lock()
+
         self.contract = self.w3.eth.contract(
             address=self.w3.to_checksum_address(settings.contract_address),
             abi=TOURIST_ID_ABI,
@@ -511,14 +517,22 @@ class TouristIDClient:
         return Web3.to_hex(Web3.keccak(text=text))
 
     def _sign_send_wait(
-        self, tx: Dict[str, Any], gas_buffer: float = 1.1, timeout: int = 180
+        self,
+        fn: Any,
+        tx_fields: Dict[str, Any],
+        gas_buffer: float = 1.1,
+        timeout: int = 180,
     ) -> TxReceipt:
-        """Estimate gas (if missing), sign, broadcast, wait for receipt."""
-        if "gas" not in tx:
-            gas_estimate = self.w3.eth.estimate_gas(tx)
-            tx["gas"] = int(gas_estimate * gas_buffer)
-        signed = self.account.sign_transaction(tx)
-        tx_hash = self.w3.eth.send_raw_transaction(signed.raw_transaction)
+        """Build (nonce, fees), estimate gas, sign, broadcast, wait for receipt."""
+        # Hold the lock until the node has the transaction, so the next
+        # "pending" nonce read sees it; waiting for the receipt can overlap
+        with self._send_lock:
+            tx = fn.build_transaction(self._build_common_tx() | tx_fields)
+            if "gas" not in tx:
+                gas_estimate = self.w3.eth.estimate_gas(tx)
+                tx["gas"] = int(gas_estimate * gas_buffer)
+            signed = self.account.sign_transaction(tx)
+            tx_hash = self.w3.eth.send_raw_transaction(signed.raw_transaction)
         receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=timeout)
         if receipt.status != 1:
             raise RuntimeError(f"Transaction failed: {tx_hash.hex()}")
@@ -564,12 +578,10 @@ class TouristIDClient:
         fn = self.contract.functions.issueID(
             tourist, kyc_b32, itin_b32, int(validity_seconds)
         )
-        tx = fn.build_transaction(
-            self._build_common_tx() | {"from": self.owner, "value": int(value_wei)}
+        receipt = self._sign_send_wait(
+            fn, {"from": self.owner, "value": int(value_wei)}
         )
 
-        receipt = self._sign_send_wait(tx)
-
         # Parse tokenId from events with multiple fallback strategies
         token_id = -1
 
@@ -621,8 +633,39 @@ class TouristIDClient:
 
     def revoke_id(self, token_id: int) -> TxReceipt:
         fn = self.contract.functions.revokeID(int(token_id))
-        tx = fn.build_transaction(self._build_common_tx() | {"from": self.owner})
-        return self._sign_send_wait(tx)
+        return self._sign_send_wait(fn, {"from": self.owner})
+
+
+def kyc_payload(user: Any, verified_by_official: int) -> bytes:
+    """Canonical KYC bytes for hashing, identical to json.dumps(..., sort_keys=True)."""
+    # Keys are written in sorted order so the default (cached, C-accelerated)
+    # encoder can be used; passing sort_keys=True builds a new encoder per call
+    return json.dumps(
+        {
+            "aadhar_hash": user.aadhar_number_hash or "",
+            "country_code": user.country_code or "",
+            "email": user.email or "",
+            "first_name": user.first_name or "",
+            "last_name": user.last_name or "",
+            "passport_hash": user.passport_number_hash or "",
+            "verified_by_official": verified_by_official,
+        }
+    ).encode()
+
+
+# One client per process so every sender shares its nonce lock
+_client: Optional[TouristIDClient] = None
+_client_lock = threading.Lock()
+
+
+def get_tourist_id_client() -> TouristIDClient:
+    """Shared TouristIDClient; connecting and the contract code check happen once."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = TouristIDClient()
+    return _client
 
 
 # ---------- Example usage ----------
@@ -0,0 +1,127 @@
+import math
+import numpy as np
+from typing import Any, List, Sequence
+from geoalchemy2 import Geography
+from geoalchemy2.functions import ST_X, ST_Y
+from sqlalchemy import and_, cast, func, true
+
+EARTH_RADIUS_KM = 6371.0
+# Slightly under the true ~110.6-111.7 km so bounding boxes never clip the radius
+KM_PER_DEGREE = 110.0
+WGS84_GEOGRAPHY = Geography(srid=4326)
+
+
+def haversine_km_batch(
+    latitude: float,
+    longitude: float,
+    latitudes: Sequence[float],
+    longitudes: Sequence[float],
+) -> np.ndarray:
+    """Distances in kilometers from one point to many points using Haversine formula."""
+    # Query point terms are plain floats computed once, not per element
+    lat1 = math.radians(latitude)
+    lon1 = math.radians(longitude)
+    cos_lat1 = math.cos(lat1)
+    lat2 = np.radians(np.asarray(latitudes, dtype=np.float64))
+    lon2 = np.radians(np.asarray(longitudes, dtype=np.float64))
+
+    a = (
+        np.sin((lat2 - lat1) / 2) ** 2
+        + cos_lat1 * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def _row_distances(
+    rows: Sequence[Any], latitude: float, longitude: float
+) -> np.ndarray:
+    """Distances to rows carrying `latitude`/`longitude` columns (see lat_lng_columns)."""
+    count = len(rows)
+    latitudes = np.fromiter((row.latitude for row in rows), np.float64, count)
+    longitudes = np.fromiter((row.longitude for row in rows), np.float64, count)
+    return haversine_km_batch(latitude, longitude, latitudes, longitudes)
+
+
+def filter_within_radius(
+    rows: Sequence[Any], latitude: float, longitude: float, radius_km: float
+) -> List[Any]:
+    """Keep rows within radius_km of the point, preserving order."""
+    if not rows:
+        return []
+
+    distances = _row_distances(rows, latitude, longitude)
+    return [rows[i] for i in np.flatnonzero(distances <= radius_km)]
+
+
+def nearest_within_radius(
+    rows: Sequence[Any],
+    latitude: float,
+    longitude: float,
+    radius_km: float,
+    limit: int,
+) -> List[Any]:
+    """Rows within radius_km of the point, nearest first, at most `limit` of them."""
+    if not rows:
+        return []
+
+    distances = _row_distances(rows, latitude, longitude)
+    inside = np.flatnonzero(distances <= radius_km)
+    nearest = inside[np.argsort(distances[inside], kind="stable")][:limit]
+    return [rows[i] for i in nearest]
+
+
+def bbox_filter(column: Any, latitude: float, longitude: float, radius_km: float):
+    """
+    Index-friendly bounding box predicate for a radius search.
+
+    Rows outside the box can never be within radius_km, so this prunes them in
+    SQL (GiST `&&`) before the exact Haversine check. Boxes that would cross a
+    pole or the antimeridian fall back to no pruning.
+    """
+    dlat = radius_km / KM_PER_DEGREE
+    max_abs_lat = abs(latitude) + dlat
+    if max_abs_lat >= 90:
+        return true()
+
+    dlon = radius_km / (KM_PER_DEGREE * math.cos(math.radians(max_abs_lat)))
+    if longitude - dlon < -180 or longitude + dlon > 180:
+        return true()
+
+    envelope = func.ST_MakeEnvelope(
+        longitude - dlon, latitude - dlat, longitude + dlon, latitude + dlat, 4326
+    )
+    return column.intersects(envelope)
+
+
+def lat_lng_columns(column: Any):
+    """latitude/longitude of a point column, projected by PostGIS (no WKB parsing)."""
+    return ST_Y(column).label("latitude"), ST_X(column).label("longitude")
+
+
+def make_point(latitude: float, longitude: float):
+    """SQL expression for a WGS84 point geometry."""
+    return func.ST_SetSRID(func.ST_MakePoint(longitude, latitude), 4326)
+
+
+def within_radius(column: Any, latitude: float, longitude: float, radius_km: float):
+    """
+    Exact radius predicate evaluated in PostGIS.
+
+    The bounding box lets the planner use the GiST index on the geometry column;
+    ST_DWithin on geography then does the exact check in meters.
+    """
+    return and_(
+        bbox_filter(column, latitude, longitude, radius_km),
+        func.ST_DWithin(
+            cast(column, WGS84_GEOGRAPHY),
+            cast(make_point(latitude, longitude), WGS84_GEOGRAPHY),
+            radius_km * 1000,
+        ),
+    )
+
+
+def distance_order(column: Any, latitude: float, longitude: float):
+    """ORDER BY expression for nearest-first results (geography KNN distance)."""
+    return cast(column, WGS84_GEOGRAPHY).op("<->")(
+        cast(make_point(latitude, longitude), WGS84_GEOGRAPHY)
+    )
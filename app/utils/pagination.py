@@ -0,0 +1,36 @@
+import time
+from typing import Any, Dict, Hashable, Tuple
+from sqlalchemy import func
+from sqlmodel import Session, select
+
+# Counts above this many rows are cached; smaller ones are cheap enough to run exactly.
+COUNT_CACHE_MIN_ROWS = 1000
+COUNT_CACHE_TTL_SECONDS = 60
+COUNT_CACHE_MAX_ENTRIES = 1024
+
+_count_cache: Dict[Hashable, Tuple[float, int]] = {}
+
+
+def count_cache_key(endpoint: str, **filters: Any) -> Hashable:
+    """Build a count cache key from the endpoint and its filters (never limit/offset)."""
+    return (endpoint, frozenset((k, v) for k, v in filters.items() if v is not None))
+
+
+def cached_count(db: Session, statement: Any, key: Hashable) -> int:
+    """Return SELECT COUNT(*) of a filtered statement, reusing recent large counts."""
+    now = time.monotonic()
+    cached = _count_cache.get(key)
+    if cached and cached[0] > now:
+        return cached[1]
+
+    total_count = db.exec(select(func.count()).select_from(statement.subquery())).one()
+
+    if total_count > COUNT_CACHE_MIN_ROWS:
+        if len(_count_cache) >= COUNT_CACHE_MAX_ENTRIES:
+            for stale_key in [k for k, (exp, _) in _count_cache.items() if exp <= now]:
+                del _count_cache[stale_key]
+            if len(_count_cache) >= COUNT_CACHE_MAX_ENTRIES:
+                _count_cache.clear()
+        _count_cache[key] = (now + COUNT_CACHE_TTL_SECONDS, total_count)
+
+    return total_count
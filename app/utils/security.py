@@ -6,6 +6,7 @@ from app.models.database.user import RefreshToken
 from sqlmodel import Session, select
 import secrets
 import string
+import time
 
 
 def hash_password(plain_password: str) -> str:
@@ -77,9 +78,7 @@ async def store_refresh_token(
     db: Session, user_id: int, token: str, expires_delta: int
 ):
     try:
-        expires_at = int(
-            (datetime.utcnow() + timedelta(seconds=expires_delta)).timestamp()
-        )
+        expires_at = int(time.time()) + expires_delta
         refresh_token = RefreshToken(
             user_id=user_id,
             token=token,
@@ -118,7 +117,7 @@ async def validate_refresh_token(db: Session, refresh_token: str) -> dict | None
             return None
 
         # Check if token is expired (additional check)
-        current_timestamp = int(datetime.utcnow().timestamp())
+        current_timestamp = int(time.time())
         if db_token.expires_at < current_timestamp:
             # Mark as revoked if expired
             db_token.is_revoked = True
@@ -0,0 +1,5 @@
+from functools import lru_cache
+from pydantic import TypeAdapter
+
+# Building a TypeAdapter compiles a validator; reuse one per type instead.
+type_adapter = lru_cache(maxsize=64)(TypeAdapter)